@@ -1,34 +1,52 @@
 """Script to run both FastAPI and Streamlit applications."""
 import subprocess
 import sys
-from pathlib import Path
+import threading
 import time
 import webbrowser
 import logging
 
+import uvicorn
+
+from src.run_streamlit import streamlit_command
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def main():
-    """Run both FastAPI and Streamlit applications."""
+    """Run both FastAPI and Streamlit applications.
+
+    FastAPI is served by uvicorn on a thread of this process; only
+    Streamlit runs as a child process. Its output is discarded rather than
+    piped, since nothing reads the pipes and a full pipe blocks the child.
+    """
+    server = None
+    api_thread = None
+    streamlit_process = None
     try:
-        # Start FastAPI
+        # Start FastAPI; loop="auto" picks uvloop when it is installed
         logger.info("Starting FastAPI server...")
-        fastapi_process = subprocess.Popen(
-            [sys.executable, "src/main.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        server = uvicorn.Server(uvicorn.Config(
+            "src.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="auto"
+        ))
+        api_thread = threading.Thread(target=server.run, name="fastapi", daemon=True)
+        api_thread.start()
         
         # Wait for FastAPI to start
-        time.sleep(2)
+        while not server.started and api_thread.is_alive():
+            time.sleep(0.1)
+        if not server.started:
+            raise RuntimeError("FastAPI server failed to start")
         
         # Start Streamlit
         logger.info("Starting Streamlit application...")
         streamlit_process = subprocess.Popen(
-            [sys.executable, "src/run_streamlit.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            streamlit_command(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         
         # Wait for Streamlit to start
@@ -47,21 +65,21 @@ def main():
         """)
         
         # Keep the script running
-        fastapi_process.wait()
         streamlit_process.wait()
         
     except KeyboardInterrupt:
         logger.info("\nStopping applications...")
-        fastapi_process.terminate()
-        streamlit_process.terminate()
-        logger.info("Applications stopped.")
     except Exception as e:
         logger.error(f"Error: {str(e)}")
-        if 'fastapi_process' in locals():
-            fastapi_process.terminate()
-        if 'streamlit_process' in locals():
-            streamlit_process.terminate()
         sys.exit(1)
+    finally:
+        if streamlit_process is not None and streamlit_process.poll() is None:
+            streamlit_process.terminate()
+            streamlit_process.wait()
+        if server is not None:
+            server.should_exit = True
+            api_thread.join(timeout=10)
+        logger.info("Applications stopped.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
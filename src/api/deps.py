@@ -1,33 +1,40 @@
 """FastAPI dependencies module."""
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlite3 import Connection
 
-from src.database.connection import DatabaseConnection
+from src.database.pool import ConnectionPool
 from src.config.settings import get_settings
 
 settings = get_settings()
 
-async def get_db() -> Generator[Connection, None, None]:
+def get_db(request: Request) -> Generator[Connection, None, None]:
     """Database dependency.
     
+    Declared synchronous so FastAPI runs it in its threadpool; waiting for a
+    free pooled connection never blocks the event loop.
+    
+    Args:
+        request: Incoming request, used to reach the application's pool
+    
     Yields:
         SQLite connection from connection pool
     
     Raises:
         HTTPException: If database connection fails
     """
+    pool: ConnectionPool = request.app.state.db_pool
     try:
-        db: DatabaseConnection = DatabaseConnection(
-            db_path=settings.get_database_path()
-        )
-        with db.get_connection() as conn:
-            yield conn
+        conn = pool.acquire()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection failed: {str(e)}"
         )
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
 
 async def verify_file_type(file_type: str) -> str:
     """Verify that the file type is allowed.
@@ -41,7 +48,7 @@ async def verify_file_type(file_type: str) -> str:
     Raises:
         HTTPException: If file type is not allowed
     """
-    if file_type not in settings.ALLOWED_FILE_TYPES:
+    if file_type not in settings.ALLOWED_FILE_TYPES_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type '{file_type}' not allowed. Must be one of: {settings.ALLOWED_FILE_TYPES}"
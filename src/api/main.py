@@ -1,15 +1,26 @@
 """Main FastAPI application."""
+from concurrent.futures import ProcessPoolExecutor
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+from src.api.routers import data, files
 from src.config.settings import get_settings
-from src.database.connection import DatabaseConnection, DatabaseConfig
+from src.database.connection import DatabaseConfig, ensure_database_initialized
+from src.database.pool import ConnectionPool
 
 settings = get_settings()
 
 app = FastAPI(
     title=settings.APP_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=DefaultResponse
 )
 
 # Add CORS middleware
@@ -21,24 +32,38 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Mount the API endpoints under the versioned prefix
+app.include_router(files.router, prefix=settings.API_V1_STR)
+app.include_router(data.router, prefix=settings.API_V1_STR)
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
     # Ensure upload directory exists
     settings.ensure_upload_folder()
     
-    # Initialize database
+    # Create the database and schema once; request handlers only borrow
+    # pooled connections
     db_config = DatabaseConfig(db_path=settings.get_database_path())
-    db = DatabaseConnection(db_config)
+    db = ensure_database_initialized(db_config)
     
     # Store database connection in app state
     app.state.db = db
+    
+    # Open pooled connections handed out by get_db
+    app.state.db_pool = ConnectionPool(
+        db_config.db_path,
+        size=settings.DB_POOL_SIZE
+    )
+    
+    # Worker processes for CPU-bound file processing
+    app.state.process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on application shutdown."""
-    # Add cleanup code here if needed
-    pass
+    app.state.process_pool.shutdown()
+    app.state.db_pool.close()
 
 @app.get("/")
 async def root():
@@ -1,11 +1,17 @@
 """Data retrieval router."""
-from typing import List, Optional
-from datetime import date, datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlite3 import Connection
+from typing import Iterator, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlite3 import Connection, Cursor
+import hashlib
 import logging
 
+from src.api.cache import files_cache
 from src.api.deps import get_db, verify_file_type
+from src.database.pool import ConnectionPool
 from src.schemas.models import (
     FileType,
     DispatchDataInDB,
@@ -16,13 +22,110 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/data", tags=["data"])
 
+# Rows pulled from SQLite per fetchmany() call when building responses
+RECORD_BATCH_SIZE = 512
+
+# Built once; validating a whole page in one call runs in pydantic-core
+# instead of constructing each model from Python
+FILE_SUMMARIES_ADAPTER = TypeAdapter(List[FileProcessingSummary])
+DISPATCH_RECORDS_ADAPTER = TypeAdapter(List[DispatchDataInDB])
+
+def iter_rows(cursor: Cursor, batch_size: int = RECORD_BATCH_SIZE) -> Iterator[tuple]:
+    """Iterate over a cursor's result set in fetchmany batches.
+    
+    Args:
+        cursor: Cursor with an executed query
+        batch_size: Number of rows fetched per batch
+        
+    Yields:
+        Result rows
+    """
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            break
+        yield from batch
+
+def _query_processed_files(
+    db: Connection,
+    file_type: Optional[FileType],
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> List[FileProcessingSummary]:
+    """Query file summaries for the given filters.
+    
+    Returns:
+        List of file processing summaries
+    """
+    # file_summary is kept current by triggers on dispatch_data
+    query = """
+    SELECT 
+        file_name,
+        file_type,
+        total_rows,
+        successful_rows,
+        duplicate_rows,
+        error_rows,
+        upload_date
+    FROM file_summary
+    WHERE 1=1
+    """
+    params = []
+    
+    if file_type:
+        query += " AND file_type = ?"
+        params.append(file_type.db_value)
+        
+    # Half-open range on the bare column so the predicate stays sargable
+    if start_date:
+        query += " AND upload_date >= ?"
+        params.append(start_date.isoformat())
+        
+    if end_date:
+        query += " AND upload_date < ?"
+        params.append((end_date + timedelta(days=1)).isoformat())
+        
+    query += " ORDER BY upload_date DESC"
+    
+    cursor = db.execute(query, params)
+    return FILE_SUMMARIES_ADAPTER.validate_python(
+        list(iter_rows(cursor)), from_attributes=True
+    )
+
+def _files_etag(db: Connection, key: tuple) -> str:
+    """Compute the ETag for a /files response.
+    
+    Derived from the latest upload and total row count in file_summary, so
+    it changes whenever rows are added or removed.
+    
+    Args:
+        db: Database connection
+        key: Filter values of the request
+        
+    Returns:
+        Quoted ETag value
+    """
+    state = tuple(db.execute(
+        "SELECT MAX(upload_date), SUM(total_rows) FROM file_summary"
+    ).fetchone())
+    return '"' + hashlib.sha1(repr((key, state)).encode()).hexdigest()[:16] + '"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 @router.get(
     "/files",
     response_model=List[FileProcessingSummary],
     status_code=status.HTTP_200_OK,
     description="Get list of processed files"
 )
-async def get_processed_files(
+def get_processed_files(
+    request: Request,
+    response: Response,
     file_type: Optional[FileType] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
@@ -30,7 +133,12 @@ async def get_processed_files(
 ) -> List[FileProcessingSummary]:
     """Get list of processed files with optional filtering.
     
+    Results are cached briefly per filter combination and carry an ETag;
+    a matching If-None-Match gets a 304 without re-running the query.
+    
     Args:
+        request: Incoming request
+        response: Outgoing response, used to set the ETag header
         file_type: Optional file type filter
         start_date: Optional start date filter
         end_date: Optional end date filter
@@ -40,36 +148,29 @@ async def get_processed_files(
         List of file processing summaries
     """
     try:
-        query = """
-        SELECT 
-            file_name,
-            file_type,
-            COUNT(*) as total_rows,
-            SUM(CASE WHEN processing_status = 'success' THEN 1 ELSE 0 END) as successful_rows,
-            SUM(CASE WHEN processing_status = 'duplicate' THEN 1 ELSE 0 END) as duplicate_rows,
-            SUM(CASE WHEN processing_status = 'error' THEN 1 ELSE 0 END) as error_rows,
-            MAX(upload_date) as upload_date
-        FROM dispatch_data
-        WHERE 1=1
-        """
-        params = []
+        key = (file_type, start_date, end_date)
+        cached = files_cache.get(key)
+        if cached is None:
+            # One read transaction, so the ETag describes exactly the
+            # listing it is cached with even if an upload commits meanwhile
+            db.execute("BEGIN")
+            try:
+                etag = _files_etag(db, key)
+                summaries = _query_processed_files(db, file_type, start_date, end_date)
+            finally:
+                db.commit()
+            cached = (etag, summaries)
+            files_cache.set(key, cached)
         
-        if file_type:
-            query += " AND file_type = ?"
-            params.append(file_type.value)
-            
-        if start_date:
-            query += " AND DATE(upload_date) >= ?"
-            params.append(start_date.isoformat())
-            
-        if end_date:
-            query += " AND DATE(upload_date) <= ?"
-            params.append(end_date.isoformat())
-            
-        query += " GROUP BY file_name, file_type ORDER BY upload_date DESC"
+        etag, summaries = cached
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
         
-        cursor = db.execute(query, params)
-        return [FileProcessingSummary(**dict(row)) for row in cursor.fetchall()]
+        response.headers["ETag"] = etag
+        return summaries
         
     except Exception as e:
         logger.error(f"Error retrieving file list: {str(e)}")
@@ -78,13 +179,73 @@ async def get_processed_files(
             detail=f"Error retrieving file list: {str(e)}"
         )
 
+# Optional /records filters as (parameter name, SQL predicate). The date
+# range is half-open on the bare column so idx_dd_prod can be used.
+RECORD_FILTERS = (
+    ("file_type", "file_type = :file_type"),
+    ("start_date", "prod_date >= :start_date"),
+    ("end_date", "prod_date < :end_date"),
+    ("work_cell", "work_cell = :work_cell"),
+    ("job_number", "job_number = :job_number"),
+    ("part_number", "part_number = :part_number"),
+)
+
+@lru_cache(maxsize=2 ** len(RECORD_FILTERS))
+def _records_sql(active_filters: Tuple[bool, ...]) -> str:
+    """Get the records query text for a combination of active filters.
+    
+    Each filter combination always maps to the same SQL string, so the
+    connection's statement cache serves it without re-preparing. Guard
+    predicates such as ":x IS NULL OR col = :x" would allow a single
+    string but stop SQLite from using the indexes.
+    
+    Args:
+        active_filters: Flag per RECORD_FILTERS entry
+        
+    Returns:
+        SQL query using named parameters
+    """
+    query = "SELECT * FROM dispatch_data WHERE 1=1"
+    for (_, predicate), active in zip(RECORD_FILTERS, active_filters):
+        if active:
+            query += f" AND {predicate}"
+    return query + " ORDER BY prod_date DESC LIMIT :limit OFFSET :offset"
+
+def _build_records_query(
+    file_type: Optional[FileType],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    work_cell: Optional[str],
+    job_number: Optional[str],
+    part_number: Optional[str],
+    limit: int,
+    offset: int
+) -> Tuple[str, dict]:
+    """Build the dispatch records query for the given filters.
+    
+    Returns:
+        Tuple of (SQL query, named query parameters)
+    """
+    params = {
+        "file_type": file_type.db_value if file_type else None,
+        "start_date": start_date.isoformat() if start_date else None,
+        "end_date": (end_date + timedelta(days=1)).isoformat() if end_date else None,
+        "work_cell": work_cell or None,
+        "job_number": job_number or None,
+        "part_number": part_number or None,
+        "limit": limit,
+        "offset": offset,
+    }
+    active_filters = tuple(params[name] is not None for name, _ in RECORD_FILTERS)
+    return _records_sql(active_filters), params
+
 @router.get(
     "/records",
     response_model=List[DispatchDataInDB],
     status_code=status.HTTP_200_OK,
     description="Get dispatch records with filtering"
 )
-async def get_dispatch_records(
+def get_dispatch_records(
     file_type: Optional[FileType] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
@@ -112,42 +273,82 @@ async def get_dispatch_records(
         List of dispatch records
     """
     try:
-        query = "SELECT * FROM dispatch_data WHERE 1=1"
-        params = []
-        
-        if file_type:
-            query += " AND file_type = ?"
-            params.append(file_type.value)
-            
-        if start_date:
-            query += " AND DATE(prod_date) >= ?"
-            params.append(start_date.isoformat())
-            
-        if end_date:
-            query += " AND DATE(prod_date) <= ?"
-            params.append(end_date.isoformat())
-            
-        if work_cell:
-            query += " AND work_cell = ?"
-            params.append(work_cell)
-            
-        if job_number:
-            query += " AND job_number = ?"
-            params.append(job_number)
-            
-        if part_number:
-            query += " AND part_number = ?"
-            params.append(part_number)
-            
-        query += " ORDER BY prod_date DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        query, params = _build_records_query(
+            file_type, start_date, end_date,
+            work_cell, job_number, part_number,
+            limit, offset
+        )
         
         cursor = db.execute(query, params)
-        return [DispatchDataInDB(**dict(row)) for row in cursor.fetchall()]
+        return DISPATCH_RECORDS_ADAPTER.validate_python(
+            list(iter_rows(cursor)), from_attributes=True
+        )
         
     except Exception as e:
         logger.error(f"Error retrieving dispatch records: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving dispatch records: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+def _stream_records(pool: ConnectionPool, query: str, params: dict) -> Iterator[bytes]:
+    """Stream query results as NDJSON lines.
+    
+    Each fetchmany batch is validated like a /records page, so every line
+    holds the same JSON as the matching /records list entry.
+    
+    The generator owns its pooled connection, since it outlives the
+    endpoint call. The first (empty) chunk is yielded once the query has
+    executed so callers can surface query errors before streaming starts.
+    """
+    with pool.connection() as conn:
+        cursor = conn.execute(query, params)
+        yield b""
+        while True:
+            batch = cursor.fetchmany(RECORD_BATCH_SIZE)
+            if not batch:
+                break
+            records = DISPATCH_RECORDS_ADAPTER.validate_python(batch, from_attributes=True)
+            yield b"".join(record.model_dump_json().encode() + b"\n" for record in records)
+
+@router.get(
+    "/records/stream",
+    status_code=status.HTTP_200_OK,
+    description="Stream dispatch records with filtering as NDJSON"
+)
+def stream_dispatch_records(
+    request: Request,
+    file_type: Optional[FileType] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    work_cell: Optional[str] = None,
+    job_number: Optional[str] = None,
+    part_number: Optional[str] = None,
+    limit: int = Query(default=100, le=1000),
+    offset: int = Query(default=0, ge=0)
+) -> StreamingResponse:
+    """Stream dispatch records as newline-delimited JSON.
+    
+    Takes the same filters as /records but serializes rows while they are
+    fetched instead of materializing the full page first.
+    
+    Returns:
+        Streaming NDJSON response, one record per line
+    """
+    query, params = _build_records_query(
+        file_type, start_date, end_date,
+        work_cell, job_number, part_number,
+        limit, offset
+    )
+    lines = _stream_records(request.app.state.db_pool, query, params)
+    
+    try:
+        next(lines)
+    except Exception as e:
+        logger.error(f"Error streaming dispatch records: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving dispatch records: {str(e)}"
+        )
+    
+    return StreamingResponse(lines, media_type="application/x-ndjson")
\ No newline at end of file
@@ -1,39 +1,118 @@
 """File upload and processing router."""
-from typing import List
+from typing import BinaryIO, List, Optional
 from pathlib import Path
+import asyncio
+import io
+import os
 import shutil
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
-from sqlite3 import Connection
+import tempfile
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request, status
 import logging
 
-from src.api.deps import get_db, verify_file_type
+from src.api.cache import files_cache
+from src.api.deps import verify_file_type
 from src.config.settings import get_settings
 from src.schemas.models import FileType, ProcessingResponse
-from src.processors import (
-    create_assy_processor,
-    create_fabcut_processor,
-    create_lp_processor,
-    create_sewdc_processor,
-    create_sewfb_processor
-)
+from src.processors import run_processor
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/files", tags=["files"])
 
-# Mapping of file types to their processor creation functions
-PROCESSOR_MAP = {
-    FileType.ASSY: create_assy_processor,
-    FileType.FABCUT: create_fabcut_processor,
-    FileType.LP: create_lp_processor,
-    FileType.SEWDC: create_sewdc_processor,
-    FileType.SEWFB: create_sewfb_processor
-}
+# Upper bound on files saved and processed at once by upload-multiple
+MAX_CONCURRENT_UPLOADS = min(8, os.cpu_count() or 1)
+
+# Chunk size for copying uploads when sendfile() cannot be used
+UPLOAD_COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+def _source_fileno(source: BinaryIO) -> Optional[int]:
+    """Get the OS file descriptor behind an upload, if it has one.
+
+    A SpooledTemporaryFile only has a descriptor once it has rolled over to
+    disk; asking for one earlier would force that rollover.
+
+    Args:
+        source: Uploaded file object
+
+    Returns:
+        File descriptor or None if the data only lives in memory
+    """
+    if getattr(source, "_rolled", True) is False:
+        return None
+    try:
+        return source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+def _copy_upload(source: BinaryIO, file_path: Path) -> None:
+    """Copy an uploaded file's contents to disk.
+
+    Uses os.sendfile() for disk-backed uploads so the kernel copies the
+    data directly, otherwise copies in large chunks.
+
+    Args:
+        source: Uploaded file object
+        file_path: Destination path
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    with open(os.open(file_path, flags, 0o644), "wb", buffering=0) as buffer:
+        source_fd = _source_fileno(source)
+        if source_fd is not None and hasattr(os, "sendfile"):
+            offset = source.tell()
+            size = os.fstat(source_fd).st_size
+            try:
+                while offset < size:
+                    sent = os.sendfile(buffer.fileno(), source_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError as e:
+                logger.debug(f"sendfile unavailable, falling back to copy: {e}")
+                buffer.seek(0)
+                buffer.truncate()
+
+        shutil.copyfileobj(source, buffer, UPLOAD_COPY_CHUNK_SIZE)
+
+def _upload_name(filename: Optional[str]) -> str:
+    """Get the name an uploaded file is saved under.
+
+    Clients may send a path; only its final component is kept so the file
+    cannot be written outside its upload directory.
+
+    Args:
+        filename: File name sent by the client
+
+    Returns:
+        Safe file name
+
+    Raises:
+        HTTPException: If no usable file name remains
+    """
+    name = Path((filename or "").replace("\\", "/")).name
+    if name in ("", ".", ".."):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file name: {filename!r}"
+        )
+    return name
+
+def _remove_upload(file_path: Path) -> None:
+    """Delete a saved upload and its per-upload directory."""
+    try:
+        file_path.unlink(missing_ok=True)
+        file_path.parent.rmdir()
+    except Exception as e:
+        logger.warning(f"Error deleting temporary file {file_path}: {str(e)}")
 
 async def save_upload_file(upload_file: UploadFile) -> Path:
     """Save uploaded file to temporary location.
 
+    Each upload gets a directory of its own, so concurrent uploads with the
+    same name never overwrite each other while the file keeps the name the
+    processor records.
+
     Args:
         upload_file: Uploaded file object
 
@@ -41,23 +120,29 @@ async def save_upload_file(upload_file: UploadFile) -> Path:
         Path to saved file
 
     Raises:
-        HTTPException: If file saving fails
+        HTTPException: If the file name is invalid or saving fails
     """
+    file_path = None
     try:
+        name = _upload_name(upload_file.filename)
+
         # Create upload directory if it doesn't exist
         settings.ensure_upload_folder()
 
         # Create file path
-        file_path = settings.UPLOAD_FOLDER / upload_file.filename
+        file_path = Path(tempfile.mkdtemp(dir=settings.UPLOAD_FOLDER)) / name
 
         # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        _copy_upload(upload_file.file, file_path)
 
         return file_path
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error saving file {upload_file.filename}: {str(e)}")
+        if file_path is not None:
+            _remove_upload(file_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error saving file: {str(e)}"
@@ -66,16 +151,19 @@ async def save_upload_file(upload_file: UploadFile) -> Path:
         upload_file.file.close()
 
 async def process_file(
+    request: Request,
     file_path: Path,
-    file_type: FileType,
-    db: Connection
+    file_type: FileType
 ) -> ProcessingResponse:
     """Process a single file.
 
+    Parsing is CPU-bound, so the processor runs in the application's
+    process pool and opens its own database connection there.
+
     Args:
+        request: Incoming request, used to reach the process pool
         file_path: Path to file to process
         file_type: Type of file
-        db: Database connection
 
     Returns:
         Processing response with results
@@ -84,12 +172,14 @@ async def process_file(
         HTTPException: If processing fails
     """
     try:
-        # Get appropriate processor
-        processor_creator = PROCESSOR_MAP[file_type]
-        processor = processor_creator(file_path, db)
-
-        # Process file
-        summary = processor.process_file()
+        loop = asyncio.get_running_loop()
+        summary = await loop.run_in_executor(
+            request.app.state.process_pool,
+            run_processor,
+            file_path,
+            file_type,
+            request.app.state.db.config.db_path
+        )
 
         return ProcessingResponse(
             file_name=file_path.name,
@@ -105,11 +195,11 @@ async def process_file(
             detail=f"Error processing file: {str(e)}"
         )
     finally:
+        # New rows change the file listings
+        files_cache.clear()
+        
         # Clean up temporary file
-        try:
-            file_path.unlink()
-        except Exception as e:
-            logger.warning(f"Error deleting temporary file {file_path}: {str(e)}")
+        _remove_upload(file_path)
 
 @router.post(
     "/upload/{file_type}",
@@ -118,17 +208,17 @@ async def process_file(
     description="Upload and process a single file"
 )
 async def upload_file(
+    request: Request,
     file_type: FileType = Depends(verify_file_type),
     file: UploadFile = File(...),
-    db: Connection = Depends(get_db),
     test_rows: Optional[int] = None
 ) -> ProcessingResponse:
     """Upload and process a single file.
 
     Args:
+        request: Incoming request
         file_type: Type of file being uploaded
         file: Uploaded file
-        db: Database connection
 
     Returns:
         Processing results
@@ -145,7 +235,7 @@ async def upload_file(
 
     # Save and process file
     file_path = await save_upload_file(file)
-    return await process_file(file_path, file_type, db)
+    return await process_file(request, file_path, file_type)
 
 @router.post(
     "/upload-multiple/{file_type}",
@@ -154,52 +244,50 @@ async def upload_file(
     description="Upload and process multiple files"
 )
 async def upload_multiple_files(
+    request: Request,
     file_type: FileType = Depends(verify_file_type),
-    files: List[UploadFile] = File(...),
-    db: Connection = Depends(get_db)
+    files: List[UploadFile] = File(...)
 ) -> List[ProcessingResponse]:
     """Upload and process multiple files.
 
+    Files are saved and processed concurrently, up to
+    MAX_CONCURRENT_UPLOADS at a time.
+
     Args:
+        request: Incoming request
         file_type: Type of files being uploaded
         files: List of uploaded files
-        db: Database connection
 
     Returns:
-        List of processing results
+        List of processing results, in the order the files were sent
 
     Raises:
         HTTPException: If file processing fails
     """
-    results = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
-    for file in files:
+    async def upload_one(file: UploadFile) -> ProcessingResponse:
         # Verify file size
         if file.size and file.size > settings.MAX_UPLOAD_SIZE:
             logger.warning(f"Skipping file {file.filename}: exceeds size limit")
-            results.append(
-                ProcessingResponse(
-                    file_name=file.filename,
-                    status="error",
-                    message=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE} bytes"
-                )
+            return ProcessingResponse(
+                file_name=file.filename,
+                status="error",
+                message=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE} bytes"
             )
-            continue
-
-        try:
-            # Save and process file
-            file_path = await save_upload_file(file)
-            result = await process_file(file_path, file_type, db)
-            results.append(result)
-
-        except Exception as e:
-            logger.error(f"Error processing file {file.filename}: {str(e)}")
-            results.append(
-                ProcessingResponse(
+
+        async with semaphore:
+            try:
+                # Save and process file
+                file_path = await save_upload_file(file)
+                return await process_file(request, file_path, file_type)
+
+            except Exception as e:
+                logger.error(f"Error processing file {file.filename}: {str(e)}")
+                return ProcessingResponse(
                     file_name=file.filename,
                     status="error",
                     message=str(e)
                 )
-            )
 
-    return results
+    return list(await asyncio.gather(*(upload_one(file) for file in files)))
\ No newline at end of file
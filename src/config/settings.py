@@ -1,8 +1,10 @@
 """Application configuration settings."""
 from pathlib import Path
-from typing import Optional
+from typing import Any, FrozenSet, Optional
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+import re
 
 class Settings(BaseSettings):
     """Application settings.
@@ -11,6 +13,7 @@ class Settings(BaseSettings):
         APP_NAME: Name of the application
         API_V1_STR: API version string
         DATABASE_URL: SQLite database URL (can be updated at runtime)
+        DB_POOL_SIZE: Number of pooled database connections used by the API
         UPLOAD_FOLDER: Path to store temporary uploaded files
         ALLOWED_FILE_TYPES: List of allowed file types
         MAX_UPLOAD_SIZE: Maximum file size in bytes (default: 100MB)
@@ -20,17 +23,37 @@ class Settings(BaseSettings):
     APP_NAME: str = "Production Data Manager"
     API_V1_STR: str = "/api/v1"
     DATABASE_URL: str = "sqlite:///./production_data.db"
+    DB_POOL_SIZE: int = 5
     UPLOAD_FOLDER: Path = Path("./uploads")
     ALLOWED_FILE_TYPES: list[str] = ["Assy", "Fabcut", "LP", "SEW-DC", "SEW-FB"]
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
     TEST_MODE: bool = False
     TEST_ROWS: Optional[int] = None
 
+    _allowed_file_types_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _file_type_pattern: Optional[re.Pattern] = PrivateAttr(default=None)
+
     class Config:
         """Pydantic configuration."""
         env_file = ".env"
         case_sensitive = True
 
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute lookups derived from the loaded settings."""
+        self._allowed_file_types_set = frozenset(self.ALLOWED_FILE_TYPES)
+        # Longest names first so one type's name never shadows a longer one
+        # starting at the same position
+        if self.ALLOWED_FILE_TYPES:
+            self._file_type_pattern = re.compile("|".join(
+                re.escape(file_type)
+                for file_type in sorted(self.ALLOWED_FILE_TYPES, key=len, reverse=True)
+            ))
+
+    @property
+    def ALLOWED_FILE_TYPES_SET(self) -> FrozenSet[str]:
+        """Allowed file types as a set for constant-time membership checks."""
+        return self._allowed_file_types_set
+
     def get_database_path(self) -> Path:
         """Get database path from DATABASE_URL."""
         return Path(self.DATABASE_URL.replace("sqlite:///", ""))
@@ -47,20 +70,22 @@ class Settings(BaseSettings):
         """Create upload folder if it doesn't exist."""
         self.UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
 
-    @classmethod
-    def detect_file_type(cls, filename: str) -> Optional[str]:
+    def detect_file_type(self, filename: str) -> Optional[str]:
         """Detect file type from filename.
 
+        Scans the filename once with a precompiled alternation of all
+        allowed types; the earliest match in the name wins.
+
         Args:
             filename: Name of the file
 
         Returns:
             Detected file type or None if not found
         """
-        for file_type in cls.ALLOWED_FILE_TYPES:
-            if file_type in filename:
-                return file_type
-        return None
+        if self._file_type_pattern is None:
+            return None
+        match = self._file_type_pattern.search(filename)
+        return match.group(0) if match else None
 
 @lru_cache()
 def get_settings() -> Settings:
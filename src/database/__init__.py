@@ -5,11 +5,15 @@ Provides database connection management and operations.
 from src.database.connection import (
     DatabaseConnection,
     DatabaseConfig,
+    ensure_database_initialized,
     get_processed_files
 )
+from src.database.pool import ConnectionPool
 
 __all__ = [
     'DatabaseConnection',
     'DatabaseConfig',
+    'ConnectionPool',
+    'ensure_database_initialized',
     'get_processed_files'
 ]
\ No newline at end of file
@@ -9,6 +9,116 @@ from contextlib import contextmanager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied on every new connection. WAL lets readers
+# and the single writer proceed concurrently; synchronous=NORMAL is safe in
+# WAL mode and drops the fsync on every commit. Reads of the first 256MB of
+# the database go through a memory map instead of read() calls.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Indexes backing the filters and ordering used by the data endpoints
+INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_dd_prod ON dispatch_data(prod_date DESC, file_type, work_cell)",
+    "CREATE INDEX IF NOT EXISTS idx_dd_job ON dispatch_data(job_number)",
+    "CREATE INDEX IF NOT EXISTS idx_dd_part ON dispatch_data(part_number)",
+    "CREATE INDEX IF NOT EXISTS idx_dd_file ON dispatch_data(file_name, file_type, upload_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_dd_status ON dispatch_data(processing_status)",
+    # Covers the processors' stored-key lookup (file_type, then the rest of
+    # DEDUP_COLUMNS), which runs while the write lock is held; without it
+    # that lookup scans the whole table
+    """CREATE INDEX IF NOT EXISTS idx_dd_dedup ON dispatch_data(
+        file_type, work_cell, job_number, part_number, job_qty, bal_qty,
+        code, prod_date, est_compl_date, and_on, m_pc, prod_hr
+    )""",
+)
+
+# Per-file processing counters, maintained by triggers on dispatch_data so
+# file listings are a point read instead of a GROUP BY over every row
+SUMMARY_STATEMENTS = (
+    """CREATE TABLE IF NOT EXISTS file_summary (
+        file_name TEXT NOT NULL,
+        file_type TEXT NOT NULL,
+        total_rows INTEGER NOT NULL DEFAULT 0,
+        successful_rows INTEGER NOT NULL DEFAULT 0,
+        duplicate_rows INTEGER NOT NULL DEFAULT 0,
+        error_rows INTEGER NOT NULL DEFAULT 0,
+        upload_date DATETIME NOT NULL,
+        PRIMARY KEY (file_name, file_type)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_fs_upload ON file_summary(upload_date DESC)",
+    """CREATE TRIGGER IF NOT EXISTS trg_dd_summary_insert
+    AFTER INSERT ON dispatch_data
+    BEGIN
+        INSERT INTO file_summary (
+            file_name, file_type, total_rows, successful_rows,
+            duplicate_rows, error_rows, upload_date
+        ) VALUES (
+            NEW.file_name, NEW.file_type, 1,
+            NEW.processing_status = 'success',
+            NEW.processing_status = 'duplicate',
+            NEW.processing_status = 'error',
+            NEW.upload_date
+        )
+        ON CONFLICT (file_name, file_type) DO UPDATE SET
+            total_rows = total_rows + 1,
+            successful_rows = successful_rows + excluded.successful_rows,
+            duplicate_rows = duplicate_rows + excluded.duplicate_rows,
+            error_rows = error_rows + excluded.error_rows,
+            upload_date = MAX(upload_date, excluded.upload_date);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_dd_summary_delete
+    AFTER DELETE ON dispatch_data
+    BEGIN
+        UPDATE file_summary SET
+            total_rows = total_rows - 1,
+            successful_rows = successful_rows - (OLD.processing_status = 'success'),
+            duplicate_rows = duplicate_rows - (OLD.processing_status = 'duplicate'),
+            error_rows = error_rows - (OLD.processing_status = 'error')
+        WHERE file_name = OLD.file_name AND file_type = OLD.file_type;
+        DELETE FROM file_summary
+        WHERE file_name = OLD.file_name AND file_type = OLD.file_type
+          AND total_rows <= 0;
+    END""",
+)
+
+# Rebuilds file_summary from dispatch_data for databases created before it
+SUMMARY_BACKFILL_SQL = """
+INSERT INTO file_summary (
+    file_name, file_type, total_rows, successful_rows,
+    duplicate_rows, error_rows, upload_date
+)
+SELECT 
+    file_name,
+    file_type,
+    COUNT(*),
+    SUM(processing_status = 'success'),
+    SUM(processing_status = 'duplicate'),
+    SUM(processing_status = 'error'),
+    MAX(upload_date)
+FROM dispatch_data
+GROUP BY file_name, file_type
+"""
+
+def apply_pragmas(conn: sqlite3.Connection, set_journal_mode: bool = True) -> None:
+    """Apply tuning PRAGMAs to a connection.
+
+    Args:
+        conn: SQLite connection object
+        set_journal_mode: Whether to switch the database to WAL. The journal
+            mode is persistent in the database file, so it only needs to be
+            set once per database.
+    """
+    if set_journal_mode:
+        conn.execute("PRAGMA journal_mode=WAL")
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
 @dataclass
 class DatabaseConfig:
     """Database configuration class."""
@@ -30,16 +140,7 @@ class DatabaseConnection:
             config: DatabaseConfig object containing connection settings
         """
         self.config = config
-        self._initialize_database()
-    
-    def _initialize_database(self) -> None:
-        """Initialize database if it doesn't exist."""
-        if not self.config.db_path.exists() and self.config.create_if_missing:
-            logger.info(f"Creating new database at {self.config.db_path}")
-            self.config.db_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with self.get_connection() as conn:
-                self._create_tables(conn)
+        self._wal_enabled = False
     
     def _create_tables(self, conn: sqlite3.Connection) -> None:
         """Create database tables.
@@ -72,12 +173,35 @@ class DatabaseConnection:
                 )"""
         try:
             conn.execute(sql)
+            for index_sql in INDEX_STATEMENTS:
+                conn.execute(index_sql)
+            for summary_sql in SUMMARY_STATEMENTS:
+                conn.execute(summary_sql)
             conn.commit()
             logger.info("Database tables created successfully")
         except sqlite3.Error as e:
             logger.error(f"Error creating tables: {e}")
             raise
     
+    def ensure_schema(self) -> None:
+        """Bring an existing database up to the current schema.
+
+        Creates any missing tables and indexes, backfills file_summary when
+        it is new, then runs ANALYZE so the query planner has statistics for
+        the indexes. Every step is idempotent, so this is safe to run on
+        each startup.
+        """
+        with self.get_connection() as conn:
+            has_summary = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'file_summary'"
+            ).fetchone() is not None
+            self._create_tables(conn)
+            if not has_summary:
+                logger.info("Backfilling file_summary from dispatch_data")
+                conn.execute(SUMMARY_BACKFILL_SQL)
+            conn.execute("ANALYZE")
+            conn.commit()
+    
     @contextmanager
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection using context manager.
@@ -92,6 +216,8 @@ class DatabaseConnection:
         try:
             conn = sqlite3.connect(self.config.db_path)
             conn.row_factory = sqlite3.Row  # Enable row factory for named columns
+            apply_pragmas(conn, set_journal_mode=not self._wal_enabled)
+            self._wal_enabled = True
             yield conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
@@ -100,6 +226,35 @@ class DatabaseConnection:
             if conn:
                 conn.close()
 
+# Database paths already bootstrapped by this process
+_initialized_paths: set[Path] = set()
+
+def ensure_database_initialized(config: DatabaseConfig) -> DatabaseConnection:
+    """Create the database and bring its schema up to date, once per process.
+
+    Meant to be called at application startup; later calls for the same
+    path return without touching the filesystem.
+
+    Args:
+        config: DatabaseConfig object containing connection settings
+
+    Returns:
+        Connection manager for the database
+    """
+    db = DatabaseConnection(config)
+    if config.db_path in _initialized_paths:
+        return db
+
+    if not config.db_path.exists():
+        if not config.create_if_missing:
+            raise FileNotFoundError(f"Database not found at {config.db_path}")
+        logger.info(f"Creating new database at {config.db_path}")
+        config.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    db.ensure_schema()
+    _initialized_paths.add(config.db_path)
+    return db
+
 def get_processed_files(db_config: DatabaseConfig) -> list[dict]:
     """Get list of processed files and their statistics.
     
@@ -109,18 +264,17 @@ def get_processed_files(db_config: DatabaseConfig) -> list[dict]:
     Returns:
         List of dictionaries containing file processing statistics
     """
-    db = DatabaseConnection(db_config)
+    db = ensure_database_initialized(db_config)
     query = """
     SELECT 
         file_name,
         file_type,
-        COUNT(*) as total_rows,
-        SUM(CASE WHEN processing_status = 'success' THEN 1 ELSE 0 END) as successful_rows,
-        SUM(CASE WHEN processing_status = 'duplicate' THEN 1 ELSE 0 END) as duplicate_rows,
-        SUM(CASE WHEN processing_status = 'error' THEN 1 ELSE 0 END) as error_rows,
-        MAX(upload_date) as last_upload
-    FROM dispatch_data
-    GROUP BY file_name, file_type
+        total_rows,
+        successful_rows,
+        duplicate_rows,
+        error_rows,
+        upload_date as last_upload
+    FROM file_summary
     ORDER BY last_upload DESC
     """
     
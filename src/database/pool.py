@@ -0,0 +1,147 @@
+"""Database connection pool module."""
+from typing import Iterator, Tuple
+from collections import namedtuple
+from functools import lru_cache
+import queue
+import sqlite3
+from pathlib import Path
+import logging
+from contextlib import contextmanager
+
+from src.database.connection import apply_pragmas
+
+logger = logging.getLogger(__name__)
+
+# Prepared statements cached per connection; leaves headroom for every
+# filter combination the data endpoints can produce
+STATEMENT_CACHE_SIZE = 256
+
+@lru_cache(maxsize=128)
+def _row_class(columns: Tuple[str, ...]) -> type:
+    """Get the namedtuple class for a result set's columns.
+
+    Args:
+        columns: Column names from cursor.description
+
+    Returns:
+        namedtuple class; invalid identifiers are renamed positionally
+    """
+    return namedtuple("Row", columns, rename=True)
+
+# Description and row class of the most recent result set. The description
+# tuple is the same object for every row of a query, so an identity check
+# avoids rebuilding the column tuple per row.
+_last_row_class: Tuple[object, type] = (None, tuple)
+
+def namedtuple_factory(cursor: sqlite3.Cursor, row: tuple) -> tuple:
+    """Row factory returning namedtuples.
+
+    Rows support attribute access and _asdict() while staying plain tuples,
+    which are cheaper to build than sqlite3.Row and to hand to pydantic
+    with from_attributes.
+
+    Args:
+        cursor: Cursor the row came from
+        row: Raw row values
+
+    Returns:
+        namedtuple instance for the row
+    """
+    global _last_row_class
+    description, row_class = _last_row_class
+    if cursor.description is not description:
+        description = cursor.description
+        row_class = _row_class(tuple(column[0] for column in description))
+        _last_row_class = (description, row_class)
+    return row_class._make(row)
+
+class ConnectionPool:
+    """Bounded pool of pre-opened SQLite connections.
+
+    Connections are opened once with PRAGMAs applied and handed out for the
+    duration of a request, so their page cache survives between requests.
+    """
+
+    def __init__(self, db_path: Path, size: int = 5, timeout: float = 30.0):
+        """Initialize connection pool.
+
+        Args:
+            db_path: Path to the SQLite database file
+            size: Number of connections kept open
+            timeout: Seconds to wait for a free connection
+        """
+        self.db_path = Path(db_path)
+        self.size = size
+        self.timeout = timeout
+        self._pool: queue.Queue = queue.Queue(maxsize=size)
+
+        for index in range(size):
+            self._pool.put(self._connect(set_journal_mode=index == 0))
+
+    def _connect(self, set_journal_mode: bool) -> sqlite3.Connection:
+        """Open a new pooled connection.
+
+        Args:
+            set_journal_mode: Whether to switch the database to WAL
+
+        Returns:
+            SQLite connection object
+        """
+        # Connections move between worker threads, never used concurrently
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = namedtuple_factory
+        apply_pragmas(conn, set_journal_mode=set_journal_mode)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take a connection from the pool.
+
+        Returns:
+            SQLite connection object
+
+        Raises:
+            sqlite3.OperationalError: If no connection becomes free in time
+        """
+        try:
+            return self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"No database connection available after {self.timeout} seconds"
+            )
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            conn: Connection previously obtained from acquire()
+        """
+        if conn.in_transaction:
+            logger.warning("Rolling back unfinished transaction on released connection")
+            conn.rollback()
+        self._pool.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection using context manager.
+
+        Yields:
+            SQLite connection object
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections in the pool."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
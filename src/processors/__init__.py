@@ -8,17 +8,24 @@ Provides processors for different file types:
 - SEW-FB (Sew Fire-Block)
 """
 from src.processors.base import FileProcessor
+from src.processors.generic import ColumnSpec, GenericDispatchProcessor
 from src.processors.assy import create_assy_processor
 from src.processors.fabcut import create_fabcut_processor
 from src.processors.lp import create_lp_processor
 from src.processors.sewdc import create_sewdc_processor
 from src.processors.sewfb import create_sewfb_processor
+from src.processors.runner import PROCESSOR_MAP, process_files, run_processor
 
 __all__ = [
     'FileProcessor',
+    'ColumnSpec',
+    'GenericDispatchProcessor',
     'create_assy_processor',
     'create_fabcut_processor',
     'create_lp_processor',
     'create_sewdc_processor',
-    'create_sewfb_processor'
+    'create_sewfb_processor',
+    'PROCESSOR_MAP',
+    'process_files',
+    'run_processor'
 ]
\ No newline at end of file
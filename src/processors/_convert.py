@@ -0,0 +1,36 @@
+"""Cell conversion helpers shared by the file processors."""
+from typing import Optional
+
+def convert_to_float(value: str) -> Optional[float]:
+    """Convert string to float, handling accounting notation.
+    
+    Args:
+        value: String value to convert
+        
+    Returns:
+        Float value or None if conversion fails
+        
+    Example:
+        >>> convert_to_float("123")
+        123.0
+        >>> convert_to_float("(123)")
+        -123.0
+    """
+    if not value or not isinstance(value, str):
+        return None
+        
+    value = value.strip()
+    if not value:
+        return None
+    
+    # Accounting notation is decided up front so float() runs once and
+    # the exception path is only taken for cells that are not numbers
+    negative = value[0] == '(' and value[-1] == ')'
+    if negative:
+        value = value[1:-1]
+        
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return -number if negative else number
@@ -1,10 +1,12 @@
 """Base class for file processors."""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Optional, Set, Tuple
 import csv
+import io
 import logging
 from datetime import datetime
+from operator import itemgetter
 
 from src.schemas.models import (
     FileType,
@@ -12,13 +14,76 @@ from src.schemas.models import (
     DispatchDataCreate,
     FileProcessingSummary
 )
-from src.utils.date_parser import parse_date, parse_datetime
 from sqlite3 import Connection
 
 logger = logging.getLogger(__name__)
 
+# Rows passed to each executemany() call
+INSERT_BATCH_SIZE = 1000
+
+# Per-row values returned by _process_row, in INSERT order
+ROW_COLUMNS = (
+    "file_type", "work_cell", "job_number", "part_number", "comments",
+    "job_qty", "bal_qty", "code", "prod_date", "est_compl_date", "and_on",
+    "m_pc", "prod_hr", "report_creation_datetime"
+)
+
+# Columns constant for a whole file. Rows are buffered with only the
+# per-row values; these are appended when the rows are inserted, once
+# report_end_date is known.
+FILE_COLUMNS = (
+    "report_start_date", "report_end_date", "report_department",
+    "upload_date", "file_name", "processing_status"
+)
+
+# dispatch_data columns written by the processors, in INSERT order
+INSERT_COLUMNS = ROW_COLUMNS + FILE_COLUMNS
+
+INSERT_SQL = (
+    f"INSERT INTO dispatch_data ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(INSERT_COLUMNS))})"
+)
+
+def _row_getter(*columns: str) -> itemgetter:
+    """Build an itemgetter reading the named columns from a row tuple."""
+    return itemgetter(*(ROW_COLUMNS.index(column) for column in columns))
+
+_PROD_DATE_INDEX = ROW_COLUMNS.index("prod_date")
+
+# Per-row columns DispatchDataCreate requires to be non-NULL
+REQUIRED_ROW_COLUMNS = (
+    "file_type", "work_cell", "job_number", "part_number", "job_qty",
+    "bal_qty", "code", "prod_date", "report_creation_datetime"
+)
+
+# Numeric columns DispatchDataCreate rejects when negative
+NON_NEGATIVE_COLUMNS = ("job_qty", "bal_qty", "m_pc", "prod_hr")
+
+_required_values = _row_getter(*REQUIRED_ROW_COLUMNS)
+_non_negative_values = _row_getter(*NON_NEGATIVE_COLUMNS)
+
+# Columns that identify a duplicate row
+DEDUP_COLUMNS = (
+    "file_type", "work_cell", "job_number", "part_number", "job_qty",
+    "bal_qty", "code", "prod_date", "est_compl_date", "and_on", "m_pc",
+    "prod_hr"
+)
+
+_dedup_values = _row_getter(*DEDUP_COLUMNS)
+
+# Dedup keys of stored rows of one file type; served by idx_dd_dedup
+EXISTING_KEYS_SQL = (
+    f"SELECT {', '.join(DEDUP_COLUMNS)} FROM dispatch_data WHERE file_type = ?"
+)
+
 class FileProcessor(ABC):
-    """Abstract base class for file processors."""
+    """Abstract base class for file processors.
+
+    Processors do not configure the connection they are given. They assume
+    it was opened through apply_pragmas() (WAL journal, synchronous=NORMAL,
+    temp_store=MEMORY, a 64MB page cache and mmap), as the pooled and
+    runner connections are.
+    """
 
     def __init__(self, file_path: Path, db_conn: Connection):
         """Initialize file processor.
@@ -29,6 +94,11 @@ class FileProcessor(ABC):
         """
         self.file_path = Path(file_path)
         self.db_conn = db_conn
+        # Stored file_type value, looked up once instead of per row
+        self._file_type_db = self.file_type.db_value
+        # One cursor for every statement the processor runs; the SQL is
+        # prepared once and served from the connection's statement cache
+        self._cursor = db_conn.cursor()
         self.summary = FileProcessingSummary(
             file_name=self.file_path.name,
             file_type=self.file_type,
@@ -54,63 +124,99 @@ class FileProcessor(ABC):
         pass
 
     @abstractmethod
-    def _map_row_to_data(
-        self, 
-        row: List[str], 
-        report_start_date: str,
-        report_end_date: str,
-        report_department: str,
-        report_creation_datetime: str
-    ) -> Optional[DispatchDataCreate]:
-        """Map CSV row to data model.
+    def _process_row(self, row: List[str]) -> Optional[tuple]:
+        """Parse a CSV row into its per-row INSERT values.
+        
+        Each cell is read and converted once, straight into the tuple that
+        is inserted.
         
         Args:
             row: CSV row data
+            
+        Returns:
+            Row values in ROW_COLUMNS order, stored as they are inserted,
+            or None if row should be skipped
+        """
+        pass
+
+    def _validate_row(
+        self,
+        values: tuple,
+        report_start_date: str,
+        report_department: str
+    ) -> None:
+        """Check a row against DispatchDataCreate.
+        
+        Rows that pass the same checks as the model are accepted without
+        building it; anything else is validated through the model so it
+        fails with the model's error.
+        
+        Args:
+            values: Values returned by _process_row
             report_start_date: Report start date
-            report_end_date: Report end date
             report_department: Report department
-            report_creation_datetime: Report creation datetime
             
+        Raises:
+            ValidationError: If the row does not satisfy DispatchDataCreate
+        """
+        valid = None not in _required_values(values)
+        if valid:
+            for value in _non_negative_values(values):
+                if value is not None and value < 0:
+                    valid = False
+                    break
+        if not valid:
+            DispatchDataCreate(
+                **dict(zip(ROW_COLUMNS, values)),
+                report_start_date=report_start_date,
+                report_end_date=report_start_date,
+                report_department=report_department,
+                upload_date=self.summary.upload_date,
+                file_name=self.file_path.name
+            )
+
+    def _load_existing_keys(self) -> Set[int]:
+        """Load the dedup keys of rows already stored for this file type.
+        
+        Keys are kept as the 64-bit hash of the key tuple rather than the
+        tuple itself, so the set stays small even for a long history; a
+        false match needs a full 64-bit collision.
+        
         Returns:
-            DispatchDataCreate object or None if row should be skipped
+            Set of key hashes
         """
-        pass
+        cur = self._cursor.execute(EXISTING_KEYS_SQL, (self._file_type_db,))
+        # Plain tuples regardless of the connection's row factory
+        return {hash(tuple(row)) for row in cur}
 
-    def row_exists(self, data: Dict[str, Any]) -> bool:
-        """Check if row already exists in database.
+    @staticmethod
+    def _dedup_key(values: tuple) -> Optional[int]:
+        """Build a row's dedup key.
         
         Args:
-            data: Row data to check
+            values: Values returned by _process_row, which are already in
+                the form they are stored in
             
         Returns:
-            True if row exists, False otherwise
+            Key hash, or None if any key column is NULL; NULL columns never
+            match a stored row, so such rows are never duplicates
         """
-        sql = """SELECT COUNT(*) FROM dispatch_data WHERE
-                 file_type = ? AND work_cell = ? AND job_number = ? AND
-                 part_number = ? AND job_qty = ? AND bal_qty = ? AND
-                 code = ? AND prod_date = ? AND est_compl_date = ? AND
-                 and_on = ? AND m_pc = ? AND prod_hr = ?"""
-                 
-        cur = self.db_conn.cursor()
-        cur.execute(sql, (
-            data["file_type"],
-            data["work_cell"],
-            data["job_number"],
-            data["part_number"],
-            data["job_qty"],
-            data["bal_qty"],
-            data["code"],
-            data["prod_date"],
-            data["est_compl_date"],
-            data["and_on"],
-            data["m_pc"],
-            data["prod_hr"]
-        ))
-        return cur.fetchone()[0] > 0
+        key = _dedup_values(values)
+        if None in key:
+            return None
+        return hash(key)
 
     def process_file(self) -> FileProcessingSummary:
         """Process the file and return summary.
         
+        The file is read, parsed and validated without touching the
+        database. Only the write phase (loading stored keys, dropping
+        duplicates and inserting) runs in a transaction, opened with BEGIN
+        IMMEDIATE so the write lock is held for the inserts alone and other
+        files can be parsed meanwhile. If the connection already has a
+        transaction open, the caller owns it and commits; otherwise the file
+        is committed here, or rolled back if writing fails.
+        
         Returns:
             FileProcessingSummary object with processing results
             
@@ -118,61 +224,18 @@ class FileProcessor(ABC):
             Exception: If file processing fails
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                
-                # Extract metadata
-                report_start_date, report_department = self._extract_metadata(reader)
-                
-                # First pass to determine max prod_date
-                file.seek(0)
-                next(reader)  # Skip first row
-                next(reader)  # Skip second row
-                
-                max_prod_date = None
-                for row in reader:
-                    try:
-                        prod_date = self._get_prod_date(row)
-                        if prod_date and (max_prod_date is None or prod_date > max_prod_date):
-                            max_prod_date = prod_date
-                    except Exception as e:
-                        logger.warning(f"Error parsing prod_date: {e}")
-                
-                report_end_date = max_prod_date or report_start_date
-                
-                # Reset for second pass
-                file.seek(0)
-                reader = csv.reader(file)
-                next(reader)  # Skip first row
-                next(reader)  # Skip second row
-                
-                for row_num, row in enumerate(reader, start=1):
-                    self.summary.total_rows += 1
-                    
-                    try:
-                        # Process row
-                        data = self._map_row_to_data(
-                            row,
-                            report_start_date,
-                            report_end_date,
-                            report_department,
-                            self._get_report_creation_datetime(row)
-                        )
-                        
-                        if data is None:
-                            self.summary.skipped_rows += 1
-                            continue
-                            
-                        if self.row_exists(data.model_dump()):
-                            self.summary.duplicate_rows += 1
-                            continue
-                            
-                        self._insert_data(data)
-                        self.summary.successful_rows += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing row {row_num}: {e}")
-                        self.summary.error_rows += 1
+            rows, keys, file_values = self._parse_rows()
+            
+            if self.db_conn.in_transaction:
+                self._write_rows(rows, keys, file_values)
+            else:
+                self.db_conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._write_rows(rows, keys, file_values)
+                except Exception:
+                    self.db_conn.rollback()
+                    raise
+                self.db_conn.commit()
                 
         except Exception as e:
             logger.error(f"Error processing file: {e}")
@@ -180,49 +243,113 @@ class FileProcessor(ABC):
             
         return self.summary
 
-    def _insert_data(self, data: DispatchDataCreate) -> None:
-        """Insert data into database.
+    def _parse_rows(self) -> Tuple[List[tuple], List[Optional[int]], tuple]:
+        """Read and validate the file's rows.
         
-        Args:
-            data: Data to insert
+        Counts skipped, error and in-file duplicate rows; duplicates of
+        stored rows are only known once the write transaction is open.
+        
+        Returns:
+            Tuple of (per-row values of validated rows, their dedup keys,
+            values shared by every row in FILE_COLUMNS order)
+            
+        Raises:
+            ValueError: If the report metadata cannot be extracted
         """
-        sql = """INSERT INTO dispatch_data (
-                    file_type, work_cell, job_number, part_number, comments,
-                    job_qty, bal_qty, code, prod_date, est_compl_date, and_on,
-                    m_pc, prod_hr, report_start_date, report_end_date,
-                    report_department, report_creation_datetime, upload_date,
-                    file_name, processing_status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        # One read and one decode for the whole file; the csv module then
+        # splits lines from memory instead of pulling them through the
+        # text I/O layer one at a time
+        text = self.file_path.read_bytes().decode('utf-8')
+        reader = csv.reader(io.StringIO(text, newline=''))
+        
+        # Extract metadata
+        report_start_date, report_department = self._extract_metadata(reader)
+        
+        # Per-row values of validated rows; the per-file columns are added
+        # once the whole file has been read
+        rows: List[tuple] = []
+        keys: List[Optional[int]] = []
+        seen_keys: Set[int] = set()
+        max_prod_date = None
+        
+        for row_num, row in enumerate(reader, start=1):
+            self.summary.total_rows += 1
+            
+            try:
+                values = self._process_row(row)
                 
-        try:
-            cur = self.db_conn.cursor()
-            cur.execute(sql, tuple(data.model_dump().values()))
-            self.db_conn.commit()
-        except Exception as e:
-            self.db_conn.rollback()
-            logger.error(f"Error inserting data: {e}")
-            raise
+                if values is None:
+                    self.summary.skipped_rows += 1
+                    continue
+                
+                prod_date = values[_PROD_DATE_INDEX]
+                if max_prod_date is None or prod_date > max_prod_date:
+                    max_prod_date = prod_date
+                
+                self._validate_row(values, report_start_date, report_department)
+                key = self._dedup_key(values)
+                if key is not None:
+                    if key in seen_keys:
+                        self.summary.duplicate_rows += 1
+                        continue
+                    seen_keys.add(key)
+                
+                rows.append(values)
+                keys.append(key)
+                
+            except Exception as e:
+                logger.error(f"Error processing row {row_num}: {e}")
+                self.summary.error_rows += 1
+        
+        file_values = (
+            report_start_date,
+            max_prod_date or report_start_date,
+            report_department,
+            self.summary.upload_date,
+            self.file_path.name,
+            ProcessingStatus.SUCCESS.value
+        )
+        return rows, keys, file_values
 
-    @abstractmethod
-    def _get_prod_date(self, row: List[str]) -> Optional[str]:
-        """Extract production date from row.
+    def _write_rows(
+        self,
+        rows: List[tuple],
+        keys: List[Optional[int]],
+        file_values: tuple
+    ) -> None:
+        """Insert parsed rows that are not already stored.
+        
+        Must run inside the write transaction, so no other writer can store
+        the same rows between the key lookup and the inserts.
         
         Args:
-            row: CSV row data
-            
-        Returns:
-            Production date string in YYYY-MM-DD format or None
+            rows: Per-row values returned by _parse_rows
+            keys: Dedup keys of rows, in the same order
+            file_values: Values shared by every row, in FILE_COLUMNS order
         """
-        pass
+        existing_keys = self._load_existing_keys()
+        new_rows = [
+            row for row, key in zip(rows, keys)
+            if key is None or key not in existing_keys
+        ]
+        self.summary.duplicate_rows += len(rows) - len(new_rows)
+        self.summary.successful_rows += len(new_rows)
+        
+        for start in range(0, len(new_rows), INSERT_BATCH_SIZE):
+            self._insert_many(new_rows[start:start + INSERT_BATCH_SIZE], file_values)
 
-    @abstractmethod
-    def _get_report_creation_datetime(self, row: List[str]) -> Optional[str]:
-        """Extract report creation datetime from row.
+    def _insert_many(self, rows: List[tuple], file_values: tuple) -> None:
+        """Insert a batch of rows into the database.
+        
+        Does not commit; the surrounding transaction is committed once the
+        whole file has been processed.
         
         Args:
-            row: CSV row data
-            
-        Returns:
-            Report creation datetime string in YYYY-MM-DD HH:MM:SS format or None
+            rows: Per-row values in ROW_COLUMNS order
+            file_values: Values shared by every row, in FILE_COLUMNS order
         """
-        pass
\ No newline at end of file
+        try:
+            self._cursor.executemany(INSERT_SQL, (row + file_values for row in rows))
+        except Exception as e:
+            logger.error(f"Error inserting data: {e}")
+            raise
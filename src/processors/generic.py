@@ -0,0 +1,167 @@
+"""Column-driven processor shared by all dispatch report types."""
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import List, Optional, Tuple
+import csv
+from pathlib import Path
+from sqlite3 import Connection
+
+from src.processors._convert import convert_to_float
+from src.processors.base import FileProcessor
+from src.schemas.models import FileType
+from src.utils.date_parser import parse_date, parse_datetime
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Column layout of one dispatch report type.
+
+    Attributes:
+        file_type: Report file type
+        work_cell: Index of the work cell column
+        job_number: Index of the job number column
+        part_number: Index of the part number column
+        job_qty: Index of the job quantity column
+        bal_qty: Index of the balance quantity column
+        code: Index of the code column
+        prod_date: Index of the production date column
+        m_pc: Index of the minutes per piece column
+        prod_hr: Index of the production hours column
+        report_creation_datetime: Index of the "Printed on" column
+        empty_start: Start of the column range that is blank on empty rows
+        empty_end: End (exclusive) of the column range that is blank on empty rows
+        comments: Index of the comments column, if the report has one
+        est_compl_date: Index of the estimated completion date column, if any
+        and_on: Index of the and_on column, if the report has one
+    """
+    file_type: FileType
+    work_cell: int
+    job_number: int
+    part_number: int
+    job_qty: int
+    bal_qty: int
+    code: int
+    prod_date: int
+    m_pc: int
+    prod_hr: int
+    report_creation_datetime: int
+    empty_start: int
+    empty_end: int
+    comments: Optional[int] = None
+    est_compl_date: Optional[int] = None
+    and_on: Optional[int] = None
+
+class GenericDispatchProcessor(FileProcessor):
+    """Processor for any dispatch report described by a ColumnSpec."""
+
+    def __init__(self, file_path: Path, db_conn: Connection, spec: ColumnSpec):
+        """Initialize file processor.
+        
+        Args:
+            file_path: Path to the file to process
+            db_conn: Database connection
+            spec: Column layout of the report
+        """
+        self.spec = spec
+        # Fetch every required cell of a row with one C-level call, and
+        # bounds-check the row once against the highest index read
+        self._cells = itemgetter(
+            spec.work_cell, spec.job_number, spec.part_number, spec.job_qty,
+            spec.bal_qty, spec.code, spec.m_pc, spec.prod_hr
+        )
+        self._row_length = 1 + max(
+            index for index in (
+                spec.work_cell, spec.job_number, spec.part_number, spec.job_qty,
+                spec.bal_qty, spec.code, spec.prod_date, spec.m_pc, spec.prod_hr,
+                spec.comments, spec.est_compl_date, spec.and_on
+            ) if index is not None
+        )
+        super().__init__(file_path, db_conn)
+
+    @property
+    def file_type(self) -> FileType:
+        """Get file type."""
+        return self.spec.file_type
+
+    def _extract_metadata(self, reader: csv.reader) -> Tuple[str, str]:
+        """Extract report start date and department from file.
+        
+        Args:
+            reader: CSV reader object
+            
+        Returns:
+            Tuple of (report_start_date, report_department)
+            
+        Raises:
+            ValueError: If required metadata cannot be extracted
+        """
+        try:
+            # First row contains report start date in second column
+            report_start_date = parse_date(next(reader)[1])
+            if not report_start_date:
+                raise ValueError("Invalid report start date")
+            
+            # Second row contains department in third column
+            report_department = next(reader)[2]
+            if not report_department:
+                raise ValueError("Missing department information")
+            
+            return report_start_date, report_department
+            
+        except (StopIteration, IndexError) as e:
+            raise ValueError(f"Failed to extract metadata: {str(e)}")
+
+    def _process_row(self, row: List[str]) -> Optional[tuple]:
+        """Parse a CSV row into its per-row INSERT values.
+        
+        Args:
+            row: CSV row data
+            
+        Returns:
+            Row values in ROW_COLUMNS order or None if row should be skipped
+        """
+        spec = self.spec
+        
+        # Check if row is empty (the report's key columns are blank); one
+        # join and strip instead of stripping each cell
+        if not ''.join(row[spec.empty_start:spec.empty_end]).strip():
+            return None
+            
+        try:
+            # Extract required dates
+            prod_date = parse_date(row[spec.prod_date])
+            if not prod_date:
+                return None
+            
+            if len(row) < self._row_length:
+                raise IndexError(f"row has {len(row)} columns, expected {self._row_length}")
+            
+            (work_cell, job_number, part_number, job_qty, bal_qty,
+             code, m_pc, prod_hr) = self._cells(row)
+            
+            est_compl_date = None
+            if spec.est_compl_date is not None and row[spec.est_compl_date]:
+                est_compl_date = parse_date(row[spec.est_compl_date])
+            
+            report_creation_datetime = None
+            if len(row) > spec.report_creation_datetime:
+                report_creation_datetime = parse_datetime(row[spec.report_creation_datetime])
+            
+            return (
+                self._file_type_db,
+                work_cell,
+                job_number,
+                part_number,
+                row[spec.comments] if spec.comments is not None else None,
+                convert_to_float(job_qty),
+                convert_to_float(bal_qty),
+                code,
+                prod_date,
+                est_compl_date,
+                row[spec.and_on] if spec.and_on is not None else None,
+                convert_to_float(m_pc),
+                convert_to_float(prod_hr),
+                report_creation_datetime
+            )
+            
+        except Exception as e:
+            raise ValueError(f"Error mapping row data: {str(e)}")
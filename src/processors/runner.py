@@ -0,0 +1,101 @@
+"""Run file processors outside the API process."""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+import os
+import sqlite3
+import logging
+
+from src.database.connection import apply_pragmas
+from src.schemas.models import FileType, FileProcessingSummary
+from src.processors.assy import create_assy_processor
+from src.processors.fabcut import create_fabcut_processor
+from src.processors.lp import create_lp_processor
+from src.processors.sewdc import create_sewdc_processor
+from src.processors.sewfb import create_sewfb_processor
+
+logger = logging.getLogger(__name__)
+
+# Mapping of file types to their processor creation functions
+PROCESSOR_MAP = {
+    FileType.ASSY: create_assy_processor,
+    FileType.FABCUT: create_fabcut_processor,
+    FileType.LP: create_lp_processor,
+    FileType.SEWDC: create_sewdc_processor,
+    FileType.SEWFB: create_sewfb_processor
+}
+
+# How long a worker waits for the write lock. Workers queue for it one
+# write phase at a time, so this must cover the write phases of every other
+# file in a batch (up to MAX_CONCURRENT_UPLOADS), not just one; the 5 s
+# busy_timeout of pooled connections is too short for large reports.
+WRITE_LOCK_TIMEOUT_MS = 300_000
+
+def run_processor(
+    file_path: Path,
+    file_type: Union[FileType, str],
+    db_path: Path
+) -> FileProcessingSummary:
+    """Process one file on a connection of its own.
+
+    Safe to run in a worker process: only paths cross the process
+    boundary. The file is parsed before any lock is taken and written in a
+    single short transaction, so workers only contend for the inserts.
+    Waiting for the lock is bounded by WRITE_LOCK_TIMEOUT_MS, long enough
+    for the other workers' writes ahead in the queue to finish.
+
+    Args:
+        file_path: Path to file to process
+        file_type: Type of file
+        db_path: Path to the SQLite database
+
+    Returns:
+        Processing summary
+
+    Raises:
+        Exception: If processing fails; nothing from the file is kept
+    """
+    processor_creator = PROCESSOR_MAP[FileType(file_type)]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        apply_pragmas(conn, set_journal_mode=False)
+        conn.execute(f"PRAGMA busy_timeout={WRITE_LOCK_TIMEOUT_MS}")
+        return processor_creator(file_path, conn).process_file()
+    finally:
+        conn.close()
+
+def process_files(
+    file_paths: Sequence[Path],
+    file_type: Union[FileType, str],
+    db_path: Path,
+    max_workers: Optional[int] = None
+) -> List[FileProcessingSummary]:
+    """Process several files of one type in parallel worker processes.
+
+    Each worker runs run_processor(), so files are parsed on separate
+    cores at the same time; only their short write transactions are
+    serialized by SQLite.
+
+    Args:
+        file_paths: Paths of files to process
+        file_type: Type of the files
+        db_path: Path to the SQLite database
+        max_workers: Worker process count (default: number of CPUs)
+
+    Returns:
+        Processing summaries in the order of file_paths
+
+    Raises:
+        Exception: The first processing failure, once all files have run
+    """
+    if not file_paths:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_processor, file_path, file_type, db_path)
+            for file_path in file_paths
+        ]
+    return [future.result() for future in futures]
@@ -2,20 +2,30 @@
 import subprocess
 import sys
 from pathlib import Path
+from typing import List
 
-def main():
-    """Run the Streamlit application."""
+def streamlit_command() -> List[str]:
+    """Build the command line that serves the Streamlit app.
+
+    Returns:
+        Command and arguments for subprocess
+    """
     # Get the path to the Home.py file
     streamlit_path = Path(__file__).parent / "web" / "Home.py"
-    
-    # Run streamlit
-    subprocess.run([
+
+    return [
+        sys.executable,
+        "-m",
         "streamlit",
         "run",
         str(streamlit_path),
         "--server.port=8501",
         "--browser.serverAddress=localhost"
-    ])
+    ]
+
+def main():
+    """Run the Streamlit application."""
+    subprocess.run(streamlit_command())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
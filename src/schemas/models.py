@@ -1,6 +1,6 @@
 """Pydantic models for data validation."""
 from datetime import datetime, date
-from typing import Optional
+from typing import Any, Optional
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
@@ -27,6 +27,29 @@ class FileType(str, Enum):
             return "DC-Sew"
         return self.value
 
+# Stored file_type values mapped back to their file types
+FILE_TYPES_BY_DB_VALUE = {file_type.db_value: file_type for file_type in FileType}
+
+def file_type_from_db(value: Any) -> Any:
+    """Map a file_type read from the database back to its FileType.
+
+    Values that are not a stored form (such as the enum values themselves)
+    are passed through for normal enum validation.
+
+    Args:
+        value: file_type value to map
+
+    Returns:
+        Matching FileType, or value unchanged
+
+    Example:
+        >>> file_type_from_db("DC-Sew")
+        <FileType.SEWDC: 'SEW-DC'>
+    """
+    if isinstance(value, str):
+        return FILE_TYPES_BY_DB_VALUE.get(value, value)
+    return value
+
 class ProcessingStatus(str, Enum):
     """Enumeration of processing statuses."""
     SUCCESS = "success"
@@ -54,6 +77,11 @@ class DispatchDataBase(BaseModel):
     report_department: str
     report_creation_datetime: datetime
 
+    @validator('file_type', pre=True)
+    def map_stored_file_type(cls, v):
+        """Accept file_type as stored in the database (e.g. 'DC-Sew')."""
+        return file_type_from_db(v)
+
     @validator('job_qty', 'bal_qty', 'm_pc', 'prod_hr')
     def validate_numeric_fields(cls, v):
         """Validate numeric fields are not negative."""
@@ -62,10 +90,14 @@ class DispatchDataBase(BaseModel):
         return v
 
 class DispatchDataCreate(DispatchDataBase):
-    """Model for creating dispatch data records."""
+    """Model for creating dispatch data records.
+
+    File ingestion does not build one per row; processors insert plain
+    tuples and only use this model to report rows that fail validation.
+    """
     file_name: str
     processing_status: ProcessingStatus = Field(default=ProcessingStatus.SUCCESS)
-    upload_date: datetime = Field(default_factory=datetime.now)
+    upload_date: datetime  # One timestamp per uploaded file, set by the processor
 
 class DispatchDataInDB(DispatchDataBase):
     """Model for dispatch data records in database."""
@@ -89,6 +121,11 @@ class FileProcessingSummary(BaseModel):
     skipped_rows: int = 0
     upload_date: datetime
 
+    @validator('file_type', pre=True)
+    def map_stored_file_type(cls, v):
+        """Accept file_type as stored in the database (e.g. 'DC-Sew')."""
+        return file_type_from_db(v)
+
 class ProcessingResponse(BaseModel):
     """Response model for file processing."""
     file_name: str
@@ -1,5 +1,6 @@
 """Date parsing utilities."""
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 import logging
 import re
@@ -10,6 +11,82 @@ class DateParsingError(Exception):
     """Custom exception for date parsing errors."""
     pass
 
+# "Printed on 9/27/2024 /  3:59:22PM", as found in report footers
+_PRINTED_RE = re.compile(
+    r'Printed on (?P<mo>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4}) / *'
+    r'(?P<h>\d{1,2}):(?P<mi>\d{2}):(?P<s>\d{2})(?P<ap>AM|PM)'
+)
+
+# Formats tried by strptime for dates the fast path does not handle
+DATE_FORMATS = (
+    '%d-%b-%y',    # For "30-Sep-24"
+    '%d-%b-%Y',    # For "27-Sep-2024"
+    '%m/%d/%Y',    # For "9/27/2024"
+    '%d/%b/%y'     # For "11/Sep/24"
+)
+
+# Month abbreviations as matched by %b (case-insensitively, C locale),
+# keyed upper-case
+_MON = {
+    name: number for number, name in enumerate(
+        ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
+         'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'),
+        start=1
+    )
+}
+
+def _is_number(text: str, max_digits: int) -> bool:
+    """Check text is 1 to max_digits ASCII digits."""
+    return 0 < len(text) <= max_digits and text.isascii() and text.isdigit()
+
+def _parse_date_fast(date_str: str) -> Optional[str]:
+    """Parse the report date layouts without strptime.
+    
+    Splits on the separator and reads the parts directly instead of trying
+    each of DATE_FORMATS in turn.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        Date string in YYYY-MM-DD format or None if the string is not one of
+        DATE_FORMATS' layouts or is not a valid date
+    """
+    separator = '/' if '/' in date_str else '-'
+    parts = date_str.split(separator)
+    if len(parts) != 3:
+        return None
+    first, middle, year_str = parts
+    
+    if separator == '/' and _is_number(middle, 2):
+        # %m/%d/%Y
+        if not (_is_number(first, 2) and len(year_str) == 4 and _is_number(year_str, 4)):
+            return None
+        month, day, year = int(first), int(middle), int(year_str)
+    else:
+        # %d-%b-%y, %d-%b-%Y and %d/%b/%y
+        month = _MON.get(middle.upper())
+        if month is None or not _is_number(first, 2):
+            return None
+        day = int(first)
+        if len(year_str) == 2 and _is_number(year_str, 2):
+            year = int(year_str)
+            # Same pivot as %y: 69-99 are 1900s, 00-68 are 2000s
+            year += 1900 if year >= 69 else 2000
+        elif separator == '-' and len(year_str) == 4 and _is_number(year_str, 4):
+            year = int(year_str)
+        else:
+            return None
+    
+    try:
+        date(year, month, day)
+    except ValueError:
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+# Report columns repeat a handful of distinct dates across every row, so
+# parses are cached per input string
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> Optional[str]:
     """Parse date string into standardized format.
     
@@ -32,23 +109,20 @@ def parse_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
 
-    date_formats = [
-        '%d-%b-%y',    # For "30-Sep-24"
-        '%d-%b-%Y',    # For "27-Sep-2024"
-        '%m/%d/%Y',    # For "9/27/2024"
-        '%d-%b-%y',    # For "11-Oct-24"
-        '%d/%b/%y'     # For "11/Sep/24"
-    ]
+    parsed = _parse_date_fast(date_str)
+    if parsed is not None:
+        return parsed
 
-    for date_format in date_formats:
+    for date_format in DATE_FORMATS:
         try:
-            return datetime.strptime(date_str, date_format).strftime('%Y-%m-%d')
+            return datetime.strptime(date_str, date_format).date().isoformat()
         except ValueError:
             continue
     
     logger.warning(f"Could not parse date: {date_str}")
     return None
 
+@lru_cache(maxsize=4096)
 def parse_datetime(datetime_str: str) -> Optional[str]:
     """Parse datetime string into standardized format.
     
@@ -70,27 +144,37 @@ def parse_datetime(datetime_str: str) -> Optional[str]:
         return None
 
     # For "Printed on 9/27/2024 /  3:59:22PM" format
-    pattern = r'Printed on (\d{1,2}/\d{1,2}/\d{4}) / *(\d{1,2}:\d{2}:\d{2})(AM|PM)'
-    match = re.search(pattern, datetime_str)
+    match = _PRINTED_RE.search(datetime_str)
 
     if match:
-        date_str, time_str, ampm = match.groups()
-        dt_str = f"{date_str} {time_str} {ampm}"
-        try:
-            dt = datetime.strptime(dt_str, '%m/%d/%Y %I:%M:%S %p')
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            pass
+        # The groups are already the numbers; build the value from them
+        # rather than re-parsing the text with strptime. isoformat() pads
+        # the year to four digits, as parse_date() does; strftime('%Y')
+        # does not on every platform
+        hour = int(match['h'])
+        if 1 <= hour <= 12:
+            if match['ap'] == 'PM':
+                hour = hour % 12 + 12
+            else:
+                hour %= 12
+            try:
+                dt = datetime(
+                    int(match['y']), int(match['mo']), int(match['d']),
+                    hour, int(match['mi']), int(match['s'])
+                )
+                return dt.isoformat(sep=' ', timespec='seconds')
+            except ValueError:
+                pass
 
     # For "2024-09-27 16:12:15" format
     try:
-        return datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
+        return datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S').isoformat(sep=' ', timespec='seconds')
     except ValueError:
         pass
 
     # For "2024-10-14T20:04:43.342962" format
     try:
-        return datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f').strftime('%Y-%m-%d %H:%M:%S')
+        return datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f').isoformat(sep=' ', timespec='seconds')
     except ValueError:
         pass
 
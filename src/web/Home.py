@@ -1,13 +1,13 @@
 """Main page of the Streamlit application."""
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
-import requests
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
 import logging
 
 from src.config.settings import get_settings
 from src.schemas.models import FileType
+from src.web.client import REQUEST_TIMEOUT, create_session, parse_json
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
@@ -16,10 +16,67 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+# Seconds API responses are reused across reruns
+CACHE_TTL = 60
+
 def init_session_state():
     """Initialize session state variables."""
     if 'api_url' not in st.session_state:
         st.session_state.api_url = f"http://localhost:8000{settings.API_V1_STR}"
+    if 'http' not in st.session_state:
+        st.session_state.http = create_session()
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _load_processed_files(
+    file_type: Optional[str],
+    days: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Load processed files from API, cached across reruns.
+    
+    Only successful responses are cached; errors propagate so the next
+    rerun tries again.
+    
+    Args:
+        file_type: Optional file type filter
+        days: Optional number of days to look back
+        
+    Returns:
+        Processed file records as returned by the API
+    """
+    params = {}
+    if file_type:
+        params['file_type'] = file_type
+    if days:
+        params['start_date'] = (date.today() - timedelta(days=days)).isoformat()
+        
+    response = st.session_state.http.get(
+        f"{st.session_state.api_url}/data/files",
+        params=params,
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return parse_json(response)
+
+def _fetch_file_records(
+    file_type: Optional[str] = None,
+    days: Optional[int] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch processed file records, reporting errors on the page.
+    
+    Args:
+        file_type: Optional file type filter
+        days: Optional number of days to look back
+        
+    Returns:
+        Processed file records or None if error or there are none
+    """
+    try:
+        return _load_processed_files(file_type, days) or None
+        
+    except Exception as e:
+        logger.error(f"Error fetching processed files: {e}")
+        st.error(f"Error fetching data: {str(e)}")
+        return None
 
 def fetch_processed_files(
     file_type: Optional[str] = None,
@@ -34,32 +91,49 @@ def fetch_processed_files(
     Returns:
         DataFrame with processed files data or None if error
     """
-    try:
-        params = {}
-        if file_type:
-            params['file_type'] = file_type
-        if days:
-            params['start_date'] = (datetime.now() - timedelta(days=days)).date().isoformat()
-            
-        response = requests.get(
-            f"{st.session_state.api_url}/data/files",
-            params=params
-        )
-        response.raise_for_status()
+    data = _fetch_file_records(file_type, days)
+    if data is None:
+        return None
         
-        data = response.json()
-        if not data:
-            return None
-            
-        df = pd.DataFrame(data)
-        # Convert upload_date to datetime
-        df['upload_date'] = pd.to_datetime(df['upload_date'])
-        return df
+    df = pd.DataFrame(data)
+    # Convert upload_date to datetime
+    df['upload_date'] = pd.to_datetime(df['upload_date'], format='ISO8601')
+    return df
+
+def fetch_file_stats(days: int) -> Optional[Dict[str, Any]]:
+    """Fetch aggregate statistics of recently processed files.
+    
+    Computed in one pass over the API records, without building a
+    DataFrame.
+    
+    Args:
+        days: Number of days to look back
         
-    except Exception as e:
-        logger.error(f"Error fetching processed files: {e}")
-        st.error(f"Error fetching data: {str(e)}")
+    Returns:
+        Dictionary with file count, total and successful row counts and the
+        latest upload time (None if unknown), or None if error or no files
+    """
+    data = _fetch_file_records(days=days)
+    if data is None:
         return None
+        
+    total_rows = 0
+    successful_rows = 0
+    latest_upload = None
+    for record in data:
+        total_rows += record['total_rows']
+        successful_rows += record['successful_rows']
+        if record['upload_date']:
+            upload_date = datetime.fromisoformat(record['upload_date'])
+            if latest_upload is None or upload_date > latest_upload:
+                latest_upload = upload_date
+                
+    return {
+        'count': len(data),
+        'total_rows': total_rows,
+        'successful_rows': successful_rows,
+        'latest_upload': latest_upload
+    }
 
 def main():
     """Main function for the home page."""
@@ -81,19 +155,19 @@ def main():
     # Create three columns for stats
     col1, col2, col3 = st.columns(3)
     
-    # Fetch recent data (last 30 days)
-    df = fetch_processed_files(days=30)
+    # Fetch recent statistics (last 30 days)
+    stats = fetch_file_stats(days=30)
     
-    if df is not None:
+    if stats is not None:
         with col1:
             st.metric(
                 label="Files Processed (30 days)",
-                value=len(df)
+                value=stats['count']
             )
             
         with col2:
-            total_rows = df['total_rows'].sum()
-            successful_rows = df['successful_rows'].sum()
+            total_rows = stats['total_rows']
+            successful_rows = stats['successful_rows']
             success_rate = (successful_rows / total_rows * 100) if total_rows > 0 else 0
             st.metric(
                 label="Success Rate",
@@ -101,9 +175,9 @@ def main():
             )
             
         with col3:
-            latest_upload = df['upload_date'].max()
-            if pd.notna(latest_upload):
-                time_diff = datetime.now() - latest_upload.to_pydatetime()
+            latest_upload = stats['latest_upload']
+            if latest_upload is not None:
+                time_diff = datetime.now() - latest_upload
                 hours_ago = time_diff.total_seconds() / 3600
                 if hours_ago < 1:
                     time_str = "< 1 hour ago"
@@ -154,23 +228,30 @@ def main():
     
     if df is not None and not df.empty:
         # Add custom columns for display
-        df['Success Rate'] = (df['successful_rows'] / df['total_rows'] * 100).round(1)
-        df['Upload Time'] = df['upload_date'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Reorder and select columns for display
-        display_df = df[[
-            'file_name',
-            'file_type',
-            'total_rows',
-            'successful_rows',
-            'duplicate_rows',
-            'error_rows',
-            'Success Rate',
-            'Upload Time'
-        ]].sort_values('upload_date', ascending=False)
+        # Files with no rows get no rate instead of inf
+        total_rows = df['total_rows'].where(df['total_rows'] > 0)
+        df['Success Rate'] = (df['successful_rows'] / total_rows * 100).round(1)
         
+        # Reorder and select columns for display; upload_date is formatted
+        # by the dataframe widget instead of converted to strings here
         st.dataframe(
-            display_df,
+            df.sort_values('upload_date', ascending=False),
+            column_config={
+                'upload_date': st.column_config.DatetimeColumn(
+                    'Upload Time',
+                    format='YYYY-MM-DD HH:mm:ss'
+                )
+            },
+            column_order=[
+                'file_name',
+                'file_type',
+                'total_rows',
+                'successful_rows',
+                'duplicate_rows',
+                'error_rows',
+                'Success Rate',
+                'upload_date'
+            ],
             use_container_width=True,
             hide_index=True
         )
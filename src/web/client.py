@@ -0,0 +1,65 @@
+"""HTTP client shared by the Streamlit pages."""
+from typing import Any
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as loads_json
+except ImportError:
+    loads_json = json.loads
+
+# Seconds to wait for an API response
+REQUEST_TIMEOUT = 30
+
+# Seconds to wait for an upload, which includes processing the file
+UPLOAD_TIMEOUT = 600
+
+def create_session() -> requests.Session:
+    """Create an HTTP session for API calls.
+    
+    The session keeps connections to the API alive, so the several
+    requests a page makes on every rerun reuse a socket instead of each
+    opening a new one.
+    
+    Returns:
+        Session with a connection pool mounted for HTTP and HTTPS
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+_thread_sessions = threading.local()
+
+def thread_session() -> requests.Session:
+    """Get the HTTP session of the current thread.
+    
+    requests.Session is not thread-safe, so worker threads must not share
+    the page's session. Each thread gets its own on first use; it is
+    released with the thread.
+    
+    Returns:
+        Session owned by the calling thread
+    """
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = _thread_sessions.session = create_session()
+    return session
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode an API response body as JSON.
+    
+    Parses the raw bytes with orjson when it is installed, which is
+    considerably faster than response.json() on large record pages.
+    
+    Args:
+        response: API response
+        
+    Returns:
+        Decoded JSON value
+    """
+    return loads_json(response.content)
@@ -1,15 +1,15 @@
 """File upload page of the Streamlit application."""
 import streamlit as st
-import requests
 from pathlib import Path
 import pandas as pd
-from typing import Dict, List, Optional
-import time
+from typing import Dict, List, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from src.config.settings import get_settings
 from src.schemas.models import FileType
+from src.web.client import UPLOAD_TIMEOUT, create_session, parse_json, thread_session
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
@@ -18,10 +18,15 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+# Files uploaded to the API at once
+MAX_PARALLEL_UPLOADS = 4
+
 def init_session_state():
     """Initialize session state variables."""
     if 'api_url' not in st.session_state:
         st.session_state.api_url = f"http://localhost:8000{settings.API_V1_STR}"
+    if 'http' not in st.session_state:
+        st.session_state.http = create_session()
     if 'upload_history' not in st.session_state:
         st.session_state.upload_history = []
     if 'database_path' not in st.session_state:
@@ -98,63 +103,104 @@ def preview_csv(uploaded_file) -> Optional[pd.DataFrame]:
         st.error(f"Error reading file: {str(e)}")
         return None
 
+def _upload_one(
+    api_url: str,
+    file,
+    params: Dict
+) -> Tuple[str, Dict]:
+    """Upload one file to the API.
+
+    Runs on a worker thread, so it only uses its arguments and never
+    touches st.session_state; requests go through the worker's own
+    session since sessions cannot be shared between threads.
+
+    Args:
+        api_url: Base URL of the API
+        file: StreamlitUploadedFile object
+        params: Query parameters for the upload endpoint
+
+    Returns:
+        Tuple of (detected file type, API response)
+
+    Raises:
+        ValueError: If the file type cannot be detected from the filename
+    """
+    # Detect file type
+    file_type = settings.detect_file_type(file.name)
+    if not file_type:
+        raise ValueError(f"Could not detect file type from filename: {file.name}")
+
+    # Send to API
+    response = thread_session().post(
+        f"{api_url}/files/upload/{file_type}",
+        files={"file": file},
+        params=params,
+        timeout=UPLOAD_TIMEOUT
+    )
+    response.raise_for_status()
+    return file_type, parse_json(response)
+
 def upload_files(
     files: List[str],
     progress_bar: st.progress,
     status_text: st.empty
 ) -> List[Dict]:
-    """Upload files to API."""
-    results = []
+    """Upload files to API.
+
+    Up to MAX_PARALLEL_UPLOADS files are sent at once; progress and the
+    upload history are updated here as each one finishes.
+    """
     total_files = len(files)
+    results: List[Optional[Dict]] = [None] * total_files
+    history = []
+
+    # Prepare API parameters
+    params = {}
+    if st.session_state.test_mode and st.session_state.test_rows:
+        params['test_rows'] = st.session_state.test_rows
+
+    status_text.text(f"Uploading {total_files} files...")
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_UPLOADS) as executor:
+        futures = {
+            executor.submit(
+                _upload_one,
+                st.session_state.api_url,
+                file,
+                params
+            ): (idx, file)
+            for idx, file in enumerate(files)
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            idx, file = futures[future]
+            try:
+                file_type, result = future.result()
+                results[idx] = result
+
+                # Add to upload history
+                history.append({
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "file_name": file.name,
+                    "file_type": file_type,
+                    "status": result["status"],
+                    "summary": result["summary"],
+                    "success_rate": format_success_rate(result["summary"])
+                })
+
+            except Exception as e:
+                logger.error(f"Error uploading {file.name}: {e}")
+                results[idx] = {
+                    "file_name": file.name,
+                    "status": "error",
+                    "message": str(e)
+                }
 
-    for idx, file in enumerate(files, 1):
-        try:
             # Update progress
-            progress = idx / total_files
-            progress_bar.progress(progress)
-            status_text.text(f"Uploading file {idx}/{total_files}: {file.name}")
-
-            # Detect file type
-            file_type = settings.detect_file_type(file.name)
-            if not file_type:
-                raise ValueError(f"Could not detect file type from filename: {file.name}")
-
-            # Prepare API parameters
-            params = {}
-            if st.session_state.test_mode and st.session_state.test_rows:
-                params['test_rows'] = st.session_state.test_rows
-
-            # Send to API
-            files_dict = {"file": file}
-            response = requests.post(
-                f"{st.session_state.api_url}/files/upload/{file_type}",
-                files=files_dict,
-                params=params
-            )
-            response.raise_for_status()
-
-            # Store result
-            result = response.json()
-            results.append(result)
-
-            # Add to upload history
-            st.session_state.upload_history.append({
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "file_name": file.name,
-                "file_type": file_type,
-                "status": result["status"],
-                "summary": result["summary"]
-            })
+            progress_bar.progress(done / total_files)
+            status_text.text(f"Uploaded file {done}/{total_files}: {file.name}")
 
-        except Exception as e:
-            logger.error(f"Error uploading {file.name}: {e}")
-            results.append({
-                "file_name": file.name,
-                "status": "error",
-                "message": str(e)
-            })
-
-        time.sleep(0.1)
+    st.session_state.upload_history.extend(history)
 
     progress_bar.progress(1.0)
     status_text.text("Upload complete!")
@@ -192,26 +238,33 @@ def display_results(results: List[Dict]):
             with st.expander(f"❌ {result['file_name']}", expanded=True):
                 st.error(result["message"])
 
+def format_success_rate(summary: Optional[Dict]) -> str:
+    """Format a processing summary's success rate for the history table.
+
+    Args:
+        summary: Processing summary returned by the API
+
+    Returns:
+        Percentage string or "N/A" if the file had no rows
+    """
+    if summary and summary['total_rows'] > 0:
+        return f"{(summary['successful_rows'] / summary['total_rows'] * 100):.1f}%"
+    return "N/A"
+
 def display_upload_history():
-    """Display upload history in a table format."""
+    """Display upload history in a table format.
+
+    The success rate is computed once when an upload is recorded, so
+    reruns only pick the displayed columns out of the history.
+    """
     if st.session_state.upload_history:
         st.subheader("Recent Upload History")
 
-        # Convert history to DataFrame
-        history_df = pd.DataFrame(st.session_state.upload_history)
-
-        # Add success rate column
-        if not history_df.empty and 'summary' in history_df.columns:
-            history_df['success_rate'] = history_df['summary'].apply(
-                lambda x: f"{(x['successful_rows'] / x['total_rows'] * 100):.1f}%"
-                if x and x['total_rows'] > 0
-                else "N/A"
-            )
-
         # Display selected columns
         display_cols = ['timestamp', 'file_name', 'status', 'success_rate']
+        history_df = pd.DataFrame(st.session_state.upload_history, columns=display_cols)
         st.dataframe(
-            history_df[display_cols],
+            history_df,
             use_container_width=True,
             hide_index=True
         )
@@ -270,6 +323,8 @@ def main():
                     progress_bar,
                     status_text
                 )
+                # Cached API lookups on the other pages are now stale
+                st.cache_data.clear()
 
                 display_results(results)
 
@@ -1,13 +1,14 @@
 """Data browser page of the Streamlit application."""
 import streamlit as st
 import pandas as pd
-import requests
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import io
 import logging
 
 from src.config.settings import get_settings
 from src.schemas.models import FileType
+from src.web.client import REQUEST_TIMEOUT, create_session, parse_json
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
@@ -16,10 +17,24 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
+# Seconds API responses are reused across reruns
+CACHE_TTL = 60
+
+# Record columns holding dates or datetimes
+DATE_COLUMNS = [
+    'prod_date', 'est_compl_date', 'report_start_date',
+    'report_end_date', 'report_creation_datetime', 'upload_date'
+]
+
+# Display format of DATE_COLUMNS (moment.js syntax)
+DATETIME_DISPLAY_FORMAT = "YYYY-MM-DD HH:mm:ss"
+
 def init_session_state():
     """Initialize session state variables."""
     if 'api_url' not in st.session_state:
         st.session_state.api_url = f"http://localhost:8000{settings.API_V1_STR}"
+    if 'http' not in st.session_state:
+        st.session_state.http = create_session()
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 1
     if 'records_per_page' not in st.session_state:
@@ -27,6 +42,23 @@ def init_session_state():
     if 'total_records' not in st.session_state:
         st.session_state.total_records = 0
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _load_unique_values(field: str) -> List[str]:
+    """Load unique values for a field from the API, cached across reruns.
+    
+    Args:
+        field: Field name to get unique values for
+        
+    Returns:
+        List of unique values
+    """
+    response = st.session_state.http.get(
+        f"{st.session_state.api_url}/data/unique-values/{field}",
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return parse_json(response)
+
 def fetch_unique_values(field: str) -> List[str]:
     """Fetch unique values for a field from the API.
     
@@ -37,11 +69,7 @@ def fetch_unique_values(field: str) -> List[str]:
         List of unique values
     """
     try:
-        response = requests.get(
-            f"{st.session_state.api_url}/data/unique-values/{field}"
-        )
-        response.raise_for_status()
-        return response.json()
+        return _load_unique_values(field)
     except Exception as e:
         logger.error(f"Error fetching unique values for {field}: {e}")
         return []
@@ -65,25 +93,25 @@ def fetch_data(filters: Dict, page: int, per_page: int) -> Tuple[Optional[pd.Dat
             "limit": per_page
         }
         
-        response = requests.get(
+        response = st.session_state.http.get(
             f"{st.session_state.api_url}/data/records",
-            params=params
+            params=params,
+            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         
         if not data["records"]:
             return None, 0
             
         df = pd.DataFrame(data["records"])
         
-        # Convert date columns
-        date_columns = ['prod_date', 'est_compl_date', 'report_start_date', 
-                       'report_end_date', 'report_creation_datetime', 'upload_date']
-        for col in date_columns:
+        # Convert date columns; the API sends ISO 8601 strings, so skip
+        # format inference and convert each distinct value once
+        for col in DATE_COLUMNS:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col])
+                df[col] = pd.to_datetime(df[col], format='ISO8601', errors='coerce', cache=True)
         
         return df, data["total"]
         
@@ -143,31 +171,35 @@ def render_filters() -> Dict:
                 filters["end_date"] = end_date.isoformat()
         elif date_option != "All Time":
             days = 7 if date_option == "Last 7 Days" else 30
-            filters["start_date"] = (datetime.now() - timedelta(days=days)).date().isoformat()
-            filters["end_date"] = datetime.now().date().isoformat()
+            today = date.today()
+            filters["start_date"] = (today - timedelta(days=days)).isoformat()
+            filters["end_date"] = today.isoformat()
     
     return filters
 
 def display_data(df: pd.DataFrame):
     """Display data with formatting.
     
+    Dates are formatted by the dataframe widget rather than converted to
+    strings here, and the frame is not copied; the completion rate is added
+    to a new frame so df itself is left as fetched.
+    
     Args:
         df: DataFrame to display
     """
     # Format date columns
-    date_columns = ['prod_date', 'est_compl_date', 'report_start_date', 
-                   'report_end_date', 'report_creation_datetime', 'upload_date']
-    
-    display_df = df.copy()
-    for col in date_columns:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+    column_config = {
+        col: st.column_config.DatetimeColumn(format=DATETIME_DISPLAY_FORMAT)
+        for col in DATE_COLUMNS if col in df.columns
+    }
     
     # Calculate derived columns
-    if 'job_qty' in display_df.columns and 'bal_qty' in display_df.columns:
-        display_df['completion_rate'] = ((display_df['job_qty'] - display_df['bal_qty']) / 
-                                       display_df['job_qty'] * 100).round(1)
-        display_df['completion_rate'] = display_df['completion_rate'].astype(str) + '%'
+    if 'job_qty' in df.columns and 'bal_qty' in df.columns:
+        job_qty = df['job_qty'].where(df['job_qty'] > 0)
+        df = df.assign(
+            completion_rate=((job_qty - df['bal_qty']) / job_qty * 100).round(1)
+        )
+        column_config['completion_rate'] = st.column_config.NumberColumn(format="%.1f%%")
     
     # Reorder columns for better presentation
     preferred_order = [
@@ -176,17 +208,33 @@ def display_data(df: pd.DataFrame):
     ]
     
     # Get available columns in preferred order
-    display_columns = [col for col in preferred_order if col in display_df.columns]
+    display_columns = [col for col in preferred_order if col in df.columns]
     # Add any remaining columns
-    remaining_columns = [col for col in display_df.columns if col not in display_columns]
+    remaining_columns = [col for col in df.columns if col not in display_columns]
     display_columns.extend(remaining_columns)
     
     st.dataframe(
-        display_df[display_columns],
+        df,
+        column_config=column_config,
+        column_order=display_columns,
         use_container_width=True,
         hide_index=True
     )
 
+def to_excel_bytes(df: pd.DataFrame) -> bytes:
+    """Write a DataFrame to an in-memory Excel workbook.
+    
+    Args:
+        df: DataFrame to export
+        
+    Returns:
+        Contents of the .xlsx file
+    """
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+        df.to_excel(writer, index=False)
+    return buffer.getvalue()
+
 def render_pagination(total_records: int):
     """Render pagination controls.
     
@@ -205,30 +253,19 @@ def render_pagination(total_records: int):
     total_pages = (total_records - 1) // st.session_state.records_per_page + 1
     
     with col2:
-        page_numbers = [i for i in range(max(1, st.session_state.current_page - 2),
-                                       min(total_pages + 1, st.session_state.current_page + 3))]
-        
-        st.write("Page:")
-        cols = st.columns(len(page_numbers) + 2)
-        
-        # Previous button
-        if cols[0].button("◀"):
-            st.session_state.current_page = max(1, st.session_state.current_page - 1)
-            st.experimental_rerun()
-        
-        # Page numbers
-        for i, page in enumerate(page_numbers, 1):
-            if cols[i].button(
-                str(page),
-                type="primary" if page == st.session_state.current_page else "secondary"
-            ):
-                st.session_state.current_page = page
-                st.experimental_rerun()
-        
-        # Next button
-        if cols[-1].button("▶"):
-            st.session_state.current_page = min(total_pages, st.session_state.current_page + 1)
-            st.experimental_rerun()
+        # One input instead of a button per page; the data for this run was
+        # fetched before these controls render, so a new page reruns once
+        current_page = min(st.session_state.current_page, total_pages)
+        new_page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=total_pages,
+            value=current_page,
+            step=1
+        )
+        if new_page != st.session_state.current_page:
+            st.session_state.current_page = new_page
+            st.rerun()
     
     with col3:
         st.write(f"Total records: {total_records}")
@@ -286,17 +323,12 @@ def main():
         
         with col2:
             if st.button("Export to Excel"):
-                excel_buffer = pd.ExcelWriter('data.xlsx', engine='xlsxwriter')
-                df.to_excel(excel_buffer, index=False)
-                excel_buffer.close()
-                
-                with open('data.xlsx', 'rb') as f:
-                    st.download_button(
-                        label="Download Excel",
-                        data=f,
-                        file_name=f"production_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
+                st.download_button(
+                    label="Download Excel",
+                    data=to_excel_bytes(df),
+                    file_name=f"production_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
     else:
         st.info("No data found matching the current filters.")
     
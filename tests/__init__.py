@@ -1,2 +1,6 @@
 # tests/__init__.py
 """Test package."""
+from pathlib import Path
+
+# Sample dispatch reports shared by the test packages
+FIXTURES = Path(__file__).parent / "fixtures"
@@ -0,0 +1,41 @@
+"""Shared fixtures for API tests."""
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.cache import files_cache
+from src.api.main import app
+from src.config.settings import get_settings
+from tests import FIXTURES
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Run the application against a fresh database and upload folder."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", tmp_path / "uploads")
+    files_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    files_cache.clear()
+
+@pytest.fixture
+def api_url() -> str:
+    """Base URL of the versioned API."""
+    return get_settings().API_V1_STR
+
+@pytest.fixture
+def upload(client: TestClient, api_url: str) -> Callable[[str], dict]:
+    """Upload a file type's fixture and return the response body."""
+    def upload_fixture(file_type: str) -> dict:
+        path = FIXTURES / f"{file_type}_dispatch.csv"
+        with open(path, "rb") as f:
+            response = client.post(
+                f"{api_url}/files/upload/{file_type}",
+                files={"file": (path.name, f, "text/csv")}
+            )
+        assert response.status_code == 200, response.text
+        return response.json()
+    return upload_fixture
@@ -0,0 +1,76 @@
+"""Tests for the /data/files ETag and its cache."""
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.cache import files_cache
+from src.api.routers import data
+from src.processors import run_processor
+from src.schemas.models import FileType
+from tests import FIXTURES
+
+def test_matching_etag_gets_304(client: TestClient, api_url: str, upload: Callable[[str], dict]):
+    upload("Assy")
+
+    first = client.get(f"{api_url}/data/files")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(f"{api_url}/data/files", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    # Still valid once the cache entry is rebuilt from the same data
+    files_cache.clear()
+    rebuilt = client.get(f"{api_url}/data/files", headers={"If-None-Match": etag})
+    assert rebuilt.status_code == 304
+
+    # Other filters have their own ETag
+    filtered = client.get(
+        f"{api_url}/data/files",
+        params={"file_type": "Assy"},
+        headers={"If-None-Match": etag}
+    )
+    assert filtered.status_code == 200
+
+    upload("SEW-DC")
+    changed = client.get(f"{api_url}/data/files", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 2
+
+def test_etag_matches_listing_when_upload_commits_between_reads(
+    client: TestClient,
+    api_url: str,
+    upload: Callable[[str], dict],
+    monkeypatch: pytest.MonkeyPatch
+):
+    upload("Assy")
+    db_path = client.app.state.db.config.db_path
+    reads = []
+
+    def upload_after_first_read(read):
+        def wrapper(*args):
+            result = read(*args)
+            reads.append(read)
+            if len(reads) == 1:
+                # Another upload commits between the ETag and listing reads
+                run_processor(FIXTURES / "SEW-DC_dispatch.csv", FileType.SEWDC, db_path)
+            return result
+        return wrapper
+
+    monkeypatch.setattr(data, "_files_etag", upload_after_first_read(data._files_etag))
+    monkeypatch.setattr(
+        data, "_query_processed_files", upload_after_first_read(data._query_processed_files)
+    )
+
+    first = client.get(f"{api_url}/data/files")
+    assert first.status_code == 200
+    assert len(first.json()) == 1
+
+    # Once the entry expires, the newer listing must not be reported unchanged
+    files_cache.clear()
+    second = client.get(f"{api_url}/data/files", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert len(second.json()) == 2
@@ -0,0 +1,37 @@
+"""Tests for the NDJSON records stream."""
+import json
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+
+# (query parameters, expected record count) with the Assy and SEW-DC
+# fixtures loaded; each stores jobs J100, J101 and J105
+FILTERS = [
+    ({}, 6),
+    ({"file_type": "SEW-DC"}, 3),
+    ({"file_type": "Assy", "job_number": "J100"}, 1),
+    ({"start_date": "2024-10-01", "end_date": "2024-10-01"}, 2),
+    ({"limit": 2, "offset": 1}, 2),
+    ({"job_number": "missing"}, 0),
+]
+
+@pytest.mark.parametrize("params, count", FILTERS)
+def test_stream_matches_records(
+    client: TestClient,
+    api_url: str,
+    upload: Callable[[str], dict],
+    params: dict,
+    count: int
+):
+    upload("Assy")
+    upload("SEW-DC")
+
+    records = client.get(f"{api_url}/data/records", params=params)
+    stream = client.get(f"{api_url}/data/records/stream", params=params)
+    assert records.status_code == stream.status_code == 200
+    assert stream.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in stream.text.splitlines()]
+    assert len(lines) == count
+    assert lines == records.json()
@@ -0,0 +1,30 @@
+"""SEW-DC files are stored as 'DC-Sew' but reported as 'SEW-DC'."""
+def test_upload_and_list_sewdc(client, api_url, upload):
+    body = upload("SEW-DC")
+    assert body["status"] == "success"
+    assert body["summary"]["file_type"] == "SEW-DC"
+    assert body["summary"]["successful_rows"] == 3
+
+    for params in ({}, {"file_type": "SEW-DC"}):
+        response = client.get(f"{api_url}/data/files", params=params)
+        assert response.status_code == 200, response.text
+        files = response.json()
+        assert [f["file_name"] for f in files] == ["SEW-DC_dispatch.csv"]
+        assert files[0]["file_type"] == "SEW-DC"
+        assert files[0]["successful_rows"] == 3
+
+        response = client.get(f"{api_url}/data/records", params=params)
+        assert response.status_code == 200, response.text
+        records = response.json()
+        assert len(records) == 3
+        assert {record["file_type"] for record in records} == {"SEW-DC"}
+
+def test_filters_do_not_mix_file_types(client, api_url, upload):
+    upload("SEW-DC")
+    upload("Assy")
+
+    response = client.get(f"{api_url}/data/files", params={"file_type": "Assy"})
+    assert [f["file_type"] for f in response.json()] == ["Assy"]
+
+    response = client.get(f"{api_url}/data/records", params={"file_type": "SEW-DC"})
+    assert {record["file_type"] for record in response.json()} == {"SEW-DC"}
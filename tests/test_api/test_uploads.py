@@ -0,0 +1,63 @@
+"""Tests for saving uploaded files."""
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from src.api.routers.files import save_upload_file
+from src.config.settings import get_settings
+from tests import FIXTURES
+
+def save(filename: str, content: bytes) -> Path:
+    """Save an in-memory upload and return where it was written."""
+    return asyncio.run(save_upload_file(UploadFile(io.BytesIO(content), filename=filename)))
+
+@pytest.fixture
+def upload_folder(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the upload folder at a fresh directory."""
+    folder = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "UPLOAD_FOLDER", folder)
+    return folder
+
+def test_same_name_saves_do_not_overwrite(upload_folder: Path):
+    first = save("dispatch.csv", b"first")
+    second = save("dispatch.csv", b"second")
+
+    assert first != second
+    assert first.name == second.name == "dispatch.csv"
+    assert first.read_bytes() == b"first"
+    assert second.read_bytes() == b"second"
+
+def test_saved_name_stays_in_upload_folder(upload_folder: Path):
+    for filename in ("../escaped.csv", "..\\escaped.csv", "/tmp/escaped.csv"):
+        path = save(filename, b"data")
+        assert path.name == "escaped.csv"
+        assert path.resolve().parent.parent == upload_folder.resolve()
+
+@pytest.mark.parametrize("filename", ["", ".", "..", "../"])
+def test_unusable_upload_name_is_rejected(upload_folder: Path, filename: str):
+    with pytest.raises(HTTPException) as exc_info:
+        save(filename, b"data")
+    assert exc_info.value.status_code == 400
+
+def test_same_name_uploads_both_process(client: TestClient, api_url: str):
+    # Two different reports sent under one name in a single request
+    source = (FIXTURES / "Assy_dispatch.csv").read_bytes()
+    other = source.replace(b"J10", b"K10")
+    response = client.post(
+        f"{api_url}/files/upload-multiple/Assy",
+        files=[
+            ("files", ("dispatch.csv", source, "text/csv")),
+            ("files", ("dispatch.csv", other, "text/csv")),
+        ]
+    )
+    assert response.status_code == 200, response.text
+
+    results = response.json()
+    assert [result["status"] for result in results] == ["success", "success"]
+    assert [result["summary"]["successful_rows"] for result in results] == [3, 3]
+    assert [result["file_name"] for result in results] == ["dispatch.csv", "dispatch.csv"]
+    assert list(get_settings().UPLOAD_FOLDER.iterdir()) == []
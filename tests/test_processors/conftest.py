@@ -0,0 +1,13 @@
+"""Shared fixtures for processor tests."""
+from pathlib import Path
+
+import pytest
+
+from src.database.connection import DatabaseConfig, ensure_database_initialized
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Create an empty database with the application schema."""
+    path = tmp_path / "test.db"
+    ensure_database_initialized(DatabaseConfig(db_path=path))
+    return path
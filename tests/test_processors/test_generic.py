@@ -0,0 +1,95 @@
+"""Tests for the column-driven dispatch processor.
+
+Each fixture holds the same lines laid out per its report's ColumnSpec:
+three distinct jobs, one repeat of the first job, a subtotal line, a line
+without a production date, a negative quantity and a truncated line.
+Expected counts match the per-type processor classes the specs replaced.
+"""
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from src.processors import PROCESSOR_MAP
+from src.processors.base import DEDUP_COLUMNS, EXISTING_KEYS_SQL
+from src.schemas.models import FileType
+from tests import FIXTURES
+
+# (total, successful, duplicate, error, skipped) for a first and a second
+# upload of the same fixture. Reports without an est_compl_date or and_on
+# column have a NULL in their dedup key, so their rows never count as
+# duplicates.
+EXPECTED_COUNTS = {
+    FileType.ASSY: ((8, 3, 1, 2, 2), (8, 0, 4, 2, 2)),
+    FileType.FABCUT: ((8, 4, 0, 2, 2), (8, 4, 0, 2, 2)),
+    FileType.LP: ((8, 4, 0, 2, 2), (8, 4, 0, 2, 2)),
+    FileType.SEWDC: ((8, 3, 1, 2, 2), (8, 0, 4, 2, 2)),
+    FileType.SEWFB: ((8, 4, 0, 2, 2), (8, 4, 0, 2, 2)),
+}
+
+def fixture_path(file_type: FileType) -> Path:
+    """Get the fixture file for a file type."""
+    return FIXTURES / f"{file_type.value}_dispatch.csv"
+
+def process(file_type: FileType, db_path: Path) -> tuple:
+    """Process a file type's fixture and return its summary counts."""
+    conn = sqlite3.connect(db_path)
+    try:
+        summary = PROCESSOR_MAP[file_type](fixture_path(file_type), conn).process_file()
+    finally:
+        conn.close()
+    return (
+        summary.total_rows,
+        summary.successful_rows,
+        summary.duplicate_rows,
+        summary.error_rows,
+        summary.skipped_rows,
+    )
+
+@pytest.mark.parametrize("file_type", list(FileType))
+def test_fixture_counts(file_type: FileType, db_path: Path):
+    first, second = EXPECTED_COUNTS[file_type]
+    assert process(file_type, db_path) == first
+    assert process(file_type, db_path) == second
+
+@pytest.mark.parametrize("file_type", list(FileType))
+def test_stored_rows(file_type: FileType, db_path: Path):
+    process(file_type, db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT DISTINCT file_type, job_number, job_qty, bal_qty, prod_date,
+                      report_start_date, report_end_date, report_department,
+                      report_creation_datetime, file_name
+               FROM dispatch_data ORDER BY job_number"""
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert [row[1:5] for row in rows] == [
+        ("J100", 10.0, 4.0, "2024-10-01"),
+        ("J101", 10.0, 4.0, "2024-09-30"),
+        ("J105", 10.0, 2.0, "2024-10-03"),
+    ]
+    for row in rows:
+        assert row[0] == file_type.db_value
+        assert row[5:] == (
+            "2024-09-30",
+            "2024-10-03",
+            f"Dept-{file_type.value}",
+            "2024-09-27 15:59:22",
+            fixture_path(file_type).name,
+        )
+
+def test_existing_keys_use_covering_index(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    try:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {EXISTING_KEYS_SQL}", ("Assy",)).fetchall()
+        index_columns = conn.execute("PRAGMA index_info(idx_dd_dedup)").fetchall()
+    finally:
+        conn.close()
+    assert [row[3] for row in plan] == [
+        "SEARCH dispatch_data USING COVERING INDEX idx_dd_dedup (file_type=?)"
+    ]
+    assert tuple(row[2] for row in index_columns) == DEDUP_COLUMNS
@@ -0,0 +1,134 @@
+"""Tests for running processors on their own connections."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+import time
+
+import pytest
+
+from src.database import connection
+from src.processors import (
+    FileProcessor,
+    GenericDispatchProcessor,
+    create_assy_processor,
+    process_files,
+    run_processor,
+)
+from src.processors import base
+from src.schemas.models import FileType
+from tests import FIXTURES
+
+def test_parsing_does_not_hold_write_lock(db_path: Path, monkeypatch: pytest.MonkeyPatch):
+    probe = sqlite3.connect(db_path, timeout=0)
+    lock_free = []
+    process_row = GenericDispatchProcessor._process_row
+
+    def probing_process_row(self, row):
+        # Another writer must be able to take the lock while rows are parsed
+        try:
+            probe.execute("BEGIN IMMEDIATE")
+            probe.rollback()
+            lock_free.append(True)
+        except sqlite3.OperationalError:
+            lock_free.append(False)
+        return process_row(self, row)
+
+    monkeypatch.setattr(GenericDispatchProcessor, "_process_row", probing_process_row)
+    try:
+        summary = run_processor(FIXTURES / "Assy_dispatch.csv", FileType.ASSY, db_path)
+    finally:
+        probe.close()
+
+    assert summary.successful_rows == 3
+    assert lock_free and all(lock_free)
+
+def test_queued_writers_outlast_busy_timeout(
+    db_path: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+):
+    # Each write phase takes longer than the default busy_timeout, so the
+    # later writers in the queue wait several times that long for the lock
+    monkeypatch.setattr(
+        connection,
+        "CONNECTION_PRAGMAS",
+        tuple(
+            "PRAGMA busy_timeout=50" if pragma.startswith("PRAGMA busy_timeout") else pragma
+            for pragma in connection.CONNECTION_PRAGMAS
+        )
+    )
+    write_rows = FileProcessor._write_rows
+
+    def slow_write_rows(self, *args):
+        time.sleep(0.2)
+        return write_rows(self, *args)
+
+    monkeypatch.setattr(FileProcessor, "_write_rows", slow_write_rows)
+
+    source = (FIXTURES / "Assy_dispatch.csv").read_text()
+    file_paths = []
+    for prefix in "KLMN":
+        file_path = tmp_path / f"Assy_{prefix}.csv"
+        file_path.write_text(source.replace("J10", f"{prefix}10"))
+        file_paths.append(file_path)
+
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        summaries = list(executor.map(
+            lambda file_path: run_processor(file_path, FileType.ASSY, db_path),
+            file_paths
+        ))
+
+    assert [summary.successful_rows for summary in summaries] == [3] * len(file_paths)
+
+def test_failed_write_rolls_back(db_path: Path, monkeypatch: pytest.MonkeyPatch):
+    insert_many = FileProcessor._insert_many
+    calls = []
+
+    def failing_insert_many(self, rows, file_values):
+        # Store one batch, then fail the next
+        calls.append(rows)
+        if len(calls) > 1:
+            raise sqlite3.OperationalError("disk I/O error")
+        return insert_many(self, rows, file_values)
+
+    monkeypatch.setattr(base, "INSERT_BATCH_SIZE", 1)
+    monkeypatch.setattr(FileProcessor, "_insert_many", failing_insert_many)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        processor = create_assy_processor(FIXTURES / "Assy_dispatch.csv", conn)
+        with pytest.raises(sqlite3.OperationalError):
+            processor.process_file()
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM dispatch_data").fetchone() == (0,)
+    finally:
+        conn.close()
+
+def test_process_files_commits_concurrent_files(db_path: Path, tmp_path: Path):
+    # Two Assy reports with different jobs, processed by parallel workers
+    source = (FIXTURES / "Assy_dispatch.csv").read_text()
+    first = tmp_path / "Assy_first.csv"
+    second = tmp_path / "Assy_second.csv"
+    first.write_text(source)
+    second.write_text(source.replace("J10", "K10"))
+
+    summaries = process_files([first, second], FileType.ASSY, db_path, max_workers=2)
+
+    assert [summary.file_name for summary in summaries] == [first.name, second.name]
+    for summary in summaries:
+        assert (
+            summary.total_rows,
+            summary.successful_rows,
+            summary.duplicate_rows,
+            summary.error_rows,
+            summary.skipped_rows,
+        ) == (8, 3, 1, 2, 2)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        stored = conn.execute(
+            "SELECT file_name, COUNT(*) FROM dispatch_data GROUP BY file_name ORDER BY file_name"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert stored == [(first.name, 3), (second.name, 3)]
@@ -0,0 +1,97 @@
+"""Tests for report date and datetime parsing."""
+import pytest
+
+from src.utils.date_parser import parse_date, parse_datetime
+
+@pytest.mark.parametrize("text, expected", [
+    # d-Mon-yy and d-Mon-yyyy, month names in any case
+    ("30-Sep-24", "2024-09-30"),
+    ("1-Oct-24", "2024-10-01"),
+    ("27-Sep-2024", "2024-09-27"),
+    ("3-oct-2024", "2024-10-03"),
+    ("05-DEC-2024", "2024-12-05"),
+    # d/Mon/yy
+    ("11/Sep/24", "2024-09-11"),
+    # m/d/yyyy
+    ("9/27/2024", "2024-09-27"),
+    ("09/30/2024", "2024-09-30"),
+    ("12/1/2024", "2024-12-01"),
+    # Surrounding whitespace
+    ("  30-Sep-24 ", "2024-09-30"),
+    # Years below 1000 are padded to four digits
+    ("1-Jan-0999", "0999-01-01"),
+    ("1/2/0999", "0999-01-02"),
+    # Leap days
+    ("29-Feb-24", "2024-02-29"),
+    ("2/29/2000", "2000-02-29"),
+])
+def test_parse_date(text, expected):
+    assert parse_date(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    # Two-digit years pivot like %y: 69-99 are 1900s, 00-68 are 2000s
+    ("1-Jan-00", "2000-01-01"),
+    ("31-Dec-68", "2068-12-31"),
+    ("1-Jan-69", "1969-01-01"),
+    ("31-Dec-99", "1999-12-31"),
+])
+def test_parse_date_two_digit_year_pivot(text, expected):
+    assert parse_date(text) == expected
+
+@pytest.mark.parametrize("text", [
+    # Dates that do not exist
+    "31-Feb-24",
+    "29-Feb-23",
+    "2/30/2024",
+    "13/1/2024",
+    "0-Jan-24",
+    "32-Jan-24",
+    # Layouts outside DATE_FORMATS
+    "Sep-30-24",
+    "30-Sept-24",
+    "9/27/24",
+    "11-Sep-2024x",
+    "30-Sep-124",
+    "2024-09-30",
+    "9/27/2024/1",
+    "n/a",
+    "",
+    "   ",
+    None,
+])
+def test_parse_date_invalid(text):
+    assert parse_date(text) is None
+
+@pytest.mark.parametrize("text, expected", [
+    ("Printed on 9/27/2024 /  3:59:22PM", "2024-09-27 15:59:22"),
+    ("Printed on 9/27/2024 / 3:59:22AM", "2024-09-27 03:59:22"),
+    ("Printed on 10/1/2024 /11:05:09AM", "2024-10-01 11:05:09"),
+    # 12 AM is midnight and 12 PM is noon
+    ("Printed on 9/27/2024 / 12:00:00AM", "2024-09-27 00:00:00"),
+    ("Printed on 9/27/2024 / 12:15:30AM", "2024-09-27 00:15:30"),
+    ("Printed on 9/27/2024 / 12:00:00PM", "2024-09-27 12:00:00"),
+    ("Printed on 9/27/2024 / 12:59:59PM", "2024-09-27 12:59:59"),
+    # Found anywhere in the footer cell
+    ("Page 1 Printed on 9/27/2024 /  3:59:22PM", "2024-09-27 15:59:22"),
+    # Years below 1000 are padded to four digits
+    ("Printed on 1/2/0999 / 1:00:00AM", "0999-01-02 01:00:00"),
+    # Already-normalized values
+    ("2024-09-27 16:12:15", "2024-09-27 16:12:15"),
+    ("2024-10-14T20:04:43.342962", "2024-10-14 20:04:43"),
+])
+def test_parse_datetime(text, expected):
+    assert parse_datetime(text) == expected
+
+@pytest.mark.parametrize("text", [
+    "Printed on 2/30/2024 / 1:00:00AM",
+    "Printed on 9/27/2024 / 0:30:00AM",
+    "Printed on 9/27/2024 / 13:00:00PM",
+    "Printed on 9/27/2024 / 3:60:00PM",
+    "Printed on 9/27/24 / 3:59:22PM",
+    "Printed on 9/27/2024 / 3:59:22",
+    "9/27/2024",
+    "",
+    None,
+])
+def test_parse_datetime_invalid(text):
+    assert parse_datetime(text) is None